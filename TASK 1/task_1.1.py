@@ -1,9 +1,144 @@
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import subprocess
 import random
 import time
-from collections import deque
+from collections import deque, namedtuple, OrderedDict
+from itertools import repeat
 import heapq
 from tabulate import tabulate
 import statistics
+import struct
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
+class CSRGraph:
+    def __init__(self, offsets, neighbors, weights):
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.starts = offsets.tolist()  # plain ints: indexing a numpy array yields a boxed scalar
+        self.bitsets = None
+
+    @classmethod
+    def from_edges(cls, num_nodes, src, dst, weight):
+        # store every undirected edge in both directions, grouped by source node
+        src = np.asarray(src, dtype=np.int32)
+        dst = np.asarray(dst, dtype=np.int32)
+        weight = np.asarray(weight, dtype=np.int32)
+        all_src = np.concatenate([dst, src])
+        all_dst = np.concatenate([src, dst])
+        all_w = np.concatenate([weight, weight])
+        # a stable sort keeps each row's neighbors ascending when the edges come in (i, j), i < j order
+        order = np.argsort(all_src, kind='stable')
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(all_src, minlength=num_nodes), out=offsets[1:])
+        return cls(offsets, all_dst[order], all_w[order])
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        num_nodes = len(graph)
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum([len(graph[i]) for i in range(num_nodes)], out=offsets[1:])
+        neighbors = np.fromiter((n for i in range(num_nodes) for n, _ in graph[i]), dtype=np.int32, count=offsets[-1])
+        weights = np.fromiter((w for i in range(num_nodes) for _, w in graph[i]), dtype=np.int32, count=offsets[-1])
+        return cls(offsets, neighbors, weights)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __contains__(self, node):
+        return 0 <= node < len(self)
+
+    def keys(self):
+        return range(len(self))
+
+    def __getitem__(self, node):
+        # a lazy (neighbor, weight) iterator: zip recycles its result tuple, so the only per-edge
+        # allocations are the ints tolist() hands back
+        lo, hi = self.starts[node], self.starts[node + 1]
+        return zip(self.neighbors[lo:hi].tolist(), self.weights[lo:hi].tolist())
+
+    def open_edges(self, node, expanded, cost=0):
+        # neighbors not yet flagged in the boolean array `expanded`, with cost + edge weight,
+        # filtered in numpy so the search loop only touches the edges it will actually push
+        lo, hi = self.starts[node], self.starts[node + 1]
+        nbrs = self.neighbors[lo:hi]
+        keep = ~expanded[nbrs]
+        return nbrs[keep].tolist(), (self.weights[lo:hi][keep] + cost).tolist()
+
+    def adjacency_bits(self):
+        # one Python int per node with bit v set for every neighbor v, built once and cached
+        if self.bitsets is None:
+            num_nodes = len(self)
+            row = np.zeros(num_nodes, dtype=bool)
+            self.bitsets = []
+            for node in range(num_nodes):
+                nbrs = self.neighbors[self.offsets[node]:self.offsets[node + 1]]
+                row[nbrs] = True
+                self.bitsets.append(int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little'))
+                row[nbrs] = False
+        return self.bitsets
+
+    @property
+    def num_edges(self):
+        return len(self.neighbors) // 2
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.neighbors.nbytes + self.weights.nbytes
+
+
+GRAPH_FILE_MAGIC = b"AIGRAPH1"
+GRAPH_FILE_VERSION = 1
+# magic, version, reserved, num_nodes, number of directed edge slots; arrays follow 8-byte aligned
+GRAPH_FILE_HEADER = struct.Struct("<8sIIQQ")
+
+
+def save_graph(graph, path):
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+    with open(path, "wb") as f:
+        f.write(GRAPH_FILE_HEADER.pack(GRAPH_FILE_MAGIC, GRAPH_FILE_VERSION, 0, len(graph), len(graph.neighbors)))
+        f.write(np.ascontiguousarray(graph.offsets, dtype='<i8').tobytes())
+        f.write(np.ascontiguousarray(graph.neighbors, dtype='<i4').tobytes())
+        f.write(np.ascontiguousarray(graph.weights, dtype='<i4').tobytes())
+
+
+def load_graph(path, mmap=True):
+    with open(path, "rb") as f:
+        header = f.read(GRAPH_FILE_HEADER.size)
+    if len(header) < GRAPH_FILE_HEADER.size:
+        raise ValueError(f"{path}: truncated graph file header")
+    magic, version, _, num_nodes, num_entries = GRAPH_FILE_HEADER.unpack(header)
+    if magic != GRAPH_FILE_MAGIC or version != GRAPH_FILE_VERSION:
+        raise ValueError(f"{path}: not a version {GRAPH_FILE_VERSION} graph file")
+
+    layout = [('offsets', '<i8', num_nodes + 1), ('neighbors', '<i4', num_entries), ('weights', '<i4', num_entries)]
+    expected_size = GRAPH_FILE_HEADER.size + sum(np.dtype(dtype).itemsize * count for _, dtype, count in layout)
+    if os.path.getsize(path) != expected_size:
+        raise ValueError(f"{path}: expected {expected_size} bytes, found {os.path.getsize(path)}")
+
+    arrays = {}
+    offset = GRAPH_FILE_HEADER.size
+    for field, dtype, count in layout:
+        if mmap:
+            # read-only views straight onto the page cache, nothing is copied up front
+            arrays[field] = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+        else:
+            arrays[field] = np.fromfile(path, dtype=dtype, count=count, offset=offset)
+        offset += np.dtype(dtype).itemsize * count
+    return CSRGraph(arrays['offsets'], arrays['neighbors'], arrays['weights'])
+
 
 def generate_dense_graph(num_nodes, min_weight=1, max_weight=10, density=0.7):
     graph = {i: [] for i in range(num_nodes)}
@@ -16,17 +151,60 @@ def generate_dense_graph(num_nodes, min_weight=1, max_weight=10, density=0.7):
     return graph
 
 
+def generate_dense_csr_graph(num_nodes, min_weight=1, max_weight=10, density=0.7, seed=None):
+    rng = np.random.default_rng(seed)
+    # sample the upper triangle a block of rows at a time to bound the temporary mask size
+    block_rows = max(1, 4_000_000 // max(num_nodes, 1))
+    columns = np.arange(num_nodes)
+    src, dst, weights = [], [], []
+    for lo in range(0, num_nodes, block_rows):
+        hi = min(lo + block_rows, num_nodes)
+        mask = rng.random((hi - lo, num_nodes)) < density
+        mask &= columns > np.arange(lo, hi)[:, None]
+        rows, cols = np.nonzero(mask)
+        src.append((rows + lo).astype(np.int32))
+        dst.append(cols.astype(np.int32))
+        weights.append(rng.integers(min_weight, max_weight, size=len(rows), dtype=np.int32, endpoint=True))
+    return CSRGraph.from_edges(num_nodes, np.concatenate(src), np.concatenate(dst), np.concatenate(weights))
+
+
+def gather_neighbors(graph, nodes):
+    starts = graph.offsets[nodes]
+    counts = graph.offsets[nodes + 1] - starts
+    # index of every edge slot belonging to `nodes`, laid out back to back
+    edge_index = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+    return graph.neighbors[edge_index]
+
+
+def csr_is_connected(graph):
+    num_nodes = len(graph)
+    if num_nodes == 0:
+        return False
+
+    visited = np.zeros(num_nodes, dtype=bool)
+    visited[0] = True
+    frontier = np.zeros(1, dtype=np.int64)
+    while frontier.size:
+        reached = gather_neighbors(graph, frontier)
+        frontier = np.unique(reached[~visited[reached]])
+        visited[frontier] = True
+
+    return bool(visited.all())
+
+
 def is_connected(graph):
+    if isinstance(graph, CSRGraph):
+        return csr_is_connected(graph)
     if not graph:
         return False
 
     start = next(iter(graph))
     visited = set()
-    queue = [start]
+    queue = deque([start])
     visited.add(start)
 
     while queue:
-        node = queue.pop(0)
+        node = queue.popleft()
         for neighbor, _ in graph[node]:
             if neighbor not in visited:
                 visited.add(neighbor)
@@ -51,193 +229,815 @@ def calculate_path_cost(graph, path):
     return total_cost
 
 
-def bfs(graph, start, goal):
-    visited = set()
-    queue = deque([(start, [start])])
+def reconstruct_path(parent, goal):
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+ExpansionEvent = namedtuple('ExpansionEvent', ['node', 'depth', 'cost', 'frontier_size', 'nodes_generated'])
+# yielded last (even with events=False) when a budget or cancel ends a search; the tuple it then
+# returns looks like "no path", so this is how a stopped search is told apart from an unreachable goal
+SearchStopped = namedtuple('SearchStopped', ['reason', 'nodes_generated'])
+
+
+def stop_reason(nodes_generated, start_time, max_nodes, max_time, cancel):
+    if max_nodes is not None and nodes_generated >= max_nodes:
+        return 'max_nodes'
+    if max_time is not None and time.time() - start_time >= max_time:
+        return 'max_time'
+    if cancel is not None and cancel.is_set():
+        return 'cancelled'
+    return None
+
+
+def run_search(search, stops=None):
+    # drive a search generator to completion and hand back the tuple it returns;
+    # a SearchStopped event, if any, is appended to `stops`
+    try:
+        while True:
+            event = next(search)
+            if stops is not None and isinstance(event, SearchStopped):
+                stops.append(event)
+    except StopIteration as stop:
+        return stop.value
+
+
+def iter_bfs(graph, start, goal, events=True, max_nodes=None, max_time=None, cancel=None):
+    watched = events or max_nodes is not None or max_time is not None or cancel is not None
+    parent = {}
+    expanded = np.zeros(len(graph), dtype=bool) if isinstance(graph, CSRGraph) else None
+    queue = deque([(start, None, 0)])
     nodes_generated = 0
     start_time = time.time()
 
     while queue:
-        node, path = queue.popleft()
+        node, prev, cost = queue.popleft()
         nodes_generated += 1
 
         if node == goal:
-            path_cost = calculate_path_cost(graph, path)
-            return path, nodes_generated, time.time() - start_time, path_cost
+            parent[node] = prev
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
 
-        if node not in visited:
-            visited.add(node)
-            for neighbor, _ in graph[node]:
-                if neighbor not in visited:
-                    queue.append((neighbor, path + [neighbor]))
+        if node not in parent:
+            if watched:
+                if events:
+                    yield ExpansionEvent(node, None, cost, len(queue), nodes_generated)
+                reason = stop_reason(nodes_generated, start_time, max_nodes, max_time, cancel)
+                if reason:
+                    yield SearchStopped(reason, nodes_generated)
+                    break
+            parent[node] = prev
+            if expanded is not None:
+                expanded[node] = True
+                neighbors, costs = graph.open_edges(node, expanded, cost)
+                queue.extend(zip(neighbors, repeat(node), costs))
+                continue
+            for neighbor, weight in graph[node]:
+                if neighbor not in parent:
+                    queue.append((neighbor, node, cost + weight))
 
     return [], nodes_generated, time.time() - start_time, float('inf')
 
 
-def dfs(graph, start, goal):
-    visited = set()
-    stack = [(start, [start])]
+def iter_dfs(graph, start, goal, events=True, max_nodes=None, max_time=None, cancel=None):
+    watched = events or max_nodes is not None or max_time is not None or cancel is not None
+    parent = {}
+    expanded = np.zeros(len(graph), dtype=bool) if isinstance(graph, CSRGraph) else None
+    stack = [(start, None, 0)]
     nodes_generated = 0
     start_time = time.time()
 
     while stack:
-        node, path = stack.pop()
+        node, prev, cost = stack.pop()
         nodes_generated += 1
 
         if node == goal:
-            path_cost = calculate_path_cost(graph, path)
-            return path, nodes_generated, time.time() - start_time, path_cost
+            parent[node] = prev
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
 
-        if node not in visited:
-            visited.add(node)
-            for neighbor, _ in reversed(graph[node]):
-                if neighbor not in visited:
-                    stack.append((neighbor, path + [neighbor]))
+        if node not in parent:
+            if watched:
+                if events:
+                    yield ExpansionEvent(node, None, cost, len(stack), nodes_generated)
+                reason = stop_reason(nodes_generated, start_time, max_nodes, max_time, cancel)
+                if reason:
+                    yield SearchStopped(reason, nodes_generated)
+                    break
+            parent[node] = prev
+            if expanded is not None:
+                expanded[node] = True
+                neighbors, costs = graph.open_edges(node, expanded, cost)
+                stack.extend(zip(reversed(neighbors), repeat(node), reversed(costs)))
+                continue
+            for neighbor, weight in reversed(graph[node]):
+                if neighbor not in parent:
+                    stack.append((neighbor, node, cost + weight))
 
     return [], nodes_generated, time.time() - start_time, float('inf')
 
 
-def ucs(graph, start, goal):
-    visited = set()
-    pq = [(0, start, [start])]
+def iter_ucs(graph, start, goal, events=True, max_nodes=None, max_time=None, cancel=None):
+    watched = events or max_nodes is not None or max_time is not None or cancel is not None
+    parent = {}
+    expanded = np.zeros(len(graph), dtype=bool) if isinstance(graph, CSRGraph) else None
+    pq = [(0, start, -1)]
     nodes_generated = 0
     start_time = time.time()
 
     while pq:
-        cost, node, path = heapq.heappop(pq)
+        cost, node, prev = heapq.heappop(pq)
         nodes_generated += 1
 
         if node == goal:
-            return path, nodes_generated, time.time() - start_time, cost
+            parent[node] = prev if prev >= 0 else None
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
 
-        if node not in visited:
-            visited.add(node)
+        if node not in parent:
+            if watched:
+                if events:
+                    yield ExpansionEvent(node, None, cost, len(pq), nodes_generated)
+                reason = stop_reason(nodes_generated, start_time, max_nodes, max_time, cancel)
+                if reason:
+                    yield SearchStopped(reason, nodes_generated)
+                    break
+            parent[node] = prev if prev >= 0 else None
+            if expanded is not None:
+                expanded[node] = True
+                neighbors, costs = graph.open_edges(node, expanded, cost)
+                for neighbor, new_cost in zip(neighbors, costs):
+                    heapq.heappush(pq, (new_cost, neighbor, node))
+                continue
             for neighbor, weight in graph[node]:
-                if neighbor not in visited:
-                    heapq.heappush(pq, (cost + weight, neighbor, path + [neighbor]))
+                if neighbor not in parent:
+                    heapq.heappush(pq, (cost + weight, neighbor, node))
 
     return [], nodes_generated, time.time() - start_time, float('inf')
 
 
-def dls(graph, node, goal, limit, path, nodes_generated):
-    if node == goal:
-        return path, True, nodes_generated
-    if limit <= 0:
-        return None, False, nodes_generated
+def bfs(graph, start, goal):
+    return run_search(iter_bfs(graph, start, goal, events=False))
+
+
+def dfs(graph, start, goal):
+    return run_search(iter_dfs(graph, start, goal, events=False))
+
+
+def ucs(graph, start, goal):
+    return run_search(iter_ucs(graph, start, goal, events=False))
+
+
+def max_edge_weight(graph):
+    if isinstance(graph, CSRGraph):
+        return int(graph.weights.max()) if len(graph.weights) else 0
+    return max((weight for edges in graph.values() for _, weight in edges), default=0)
+
+
+def ucs_dial(graph, start, goal, max_weight=None):
+    # Dial's algorithm: a circular array of max_weight + 1 buckets indexed by cost,
+    # valid for non-negative integer edge weights
+    if max_weight is None:
+        max_weight = max_edge_weight(graph)
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    buckets[0].append(start)
+    dist = {start: 0}
+    parent = {start: None}
+    pending = 1
+    cost = 0
+    nodes_generated = 0
+    start_time = time.time()
 
-    for neighbor, _ in graph[node]:
-        if neighbor not in path:
+    while pending:
+        bucket = buckets[cost % num_buckets]
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+            # counted like ucs counts heap pops, stale duplicates included
             nodes_generated += 1
-            new_path, found, nodes_generated = dls(
-                graph, neighbor, goal, limit - 1, path + [neighbor], nodes_generated
-            )
-            if found:
-                return new_path, True, nodes_generated
+            if dist[node] != cost:
+                continue
 
-    return None, False, nodes_generated
+            if node == goal:
+                return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
+
+            for neighbor, weight in graph[node]:
+                new_cost = cost + weight
+                if new_cost < dist.get(neighbor, new_cost + 1):
+                    dist[neighbor] = new_cost
+                    parent[neighbor] = node
+                    buckets[new_cost % num_buckets].append(neighbor)
+                    pending += 1
+        cost += 1
+
+    return [], nodes_generated, time.time() - start_time, float('inf')
 
 
-def ids(graph, start, goal, max_depth=50):
+def join_paths(forward_parent, backward_parent, meet):
+    path = reconstruct_path(forward_parent, meet)
+    back = reconstruct_path(backward_parent, meet)
+    back.reverse()
+    return path + back[1:]
+
+
+def bidirectional_bfs(graph, start, goal):
     start_time = time.time()
+    if start == goal:
+        return [start], 1, time.time() - start_time, 0
+
+    # index 0 searches from start, index 1 from goal (the graph is undirected)
+    parents = [{start: None}, {goal: None}]
+    costs = [{start: 0}, {goal: 0}]
+    frontiers = [[start], [goal]]
     nodes_generated = 0
 
-    for depth in range(max_depth):
-        path, found, nodes_generated = dls(graph, start, goal, depth, [start], nodes_generated)
-        if found:
-            path_cost = calculate_path_cost(graph, path)
-            return path, nodes_generated, time.time() - start_time, path_cost
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, other_parent = parents[side], parents[1 - side]
+        cost = costs[side]
+        next_frontier = []
+        for node in frontiers[side]:
+            nodes_generated += 1
+            for neighbor, weight in graph[node]:
+                if neighbor in parent:
+                    continue
+                parent[neighbor] = node
+                cost[neighbor] = cost[node] + weight
+                if neighbor in other_parent:
+                    path = join_paths(parents[0], parents[1], neighbor)
+                    total = costs[0][neighbor] + costs[1][neighbor]
+                    return path, nodes_generated, time.time() - start_time, total
+                next_frontier.append(neighbor)
+        frontiers[side] = next_frontier
 
     return [], nodes_generated, time.time() - start_time, float('inf')
 
 
-def run_single_test(graph, start, goal):
-    results = {}
-    # BFS
-    try:
-        bfs_path, bfs_nodes, bfs_time, bfs_cost = bfs(graph, start, goal)
-        results['BFS'] = {
-            'path_length': len(bfs_path) if bfs_path else 0,
-            'nodes_generated': bfs_nodes,
-            'time': bfs_time,
-            'cost': bfs_cost,
-            'found': len(bfs_path) > 0
-        }
-    except Exception as e:
-        print(f"BFS failed: {e}")
-        results['BFS'] = {'path_length': 0, 'nodes_generated': 0, 'time': 0, 'cost': float('inf'), 'found': False}
+def bidirectional_ucs(graph, start, goal):
+    start_time = time.time()
+    dists = [{start: 0}, {goal: 0}]
+    parents = [{start: None}, {goal: None}]
+    heaps = [[(0, start)], [(0, goal)]]
+    settled = [set(), set()]
+    best_cost = 0 if start == goal else float('inf')
+    meet = start if start == goal else None
+    nodes_generated = 0
 
-    try:
-        dfs_path, dfs_nodes, dfs_time, dfs_cost = dfs(graph, start, goal)
-        results['DFS'] = {
-            'path_length': len(dfs_path) if dfs_path else 0,
-            'nodes_generated': dfs_nodes,
-            'time': dfs_time,
-            'cost': dfs_cost,
-            'found': len(dfs_path) > 0
-        }
-    except Exception as e:
-        print(f"DFS failed: {e}")
-        results['DFS'] = {'path_length': 0, 'nodes_generated': 0, 'time': 0, 'cost': float('inf'), 'found': False}
+    while heaps[0] and heaps[1]:
+        # no undiscovered path can beat best_cost once the two frontiers' minima sum past it
+        if heaps[0][0][0] + heaps[1][0][0] >= best_cost:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dist, other_dist = dists[side], dists[1 - side]
+        parent = parents[side]
+        cost, node = heapq.heappop(heaps[side])
+        nodes_generated += 1
+        if node in settled[side] or cost > dist[node]:
+            continue
+        settled[side].add(node)
 
-    try:
-        ucs_path, ucs_nodes, ucs_time, ucs_cost = ucs(graph, start, goal)
-        results['UCS'] = {
-            'path_length': len(ucs_path) if ucs_path else 0,
-            'nodes_generated': ucs_nodes,
-            'time': ucs_time,
-            'cost': ucs_cost,
-            'found': len(ucs_path) > 0
-        }
-    except Exception as e:
-        print(f"UCS failed: {e}")
-        results['UCS'] = {'path_length': 0, 'nodes_generated': 0, 'time': 0, 'cost': float('inf'), 'found': False}
+        for neighbor, weight in graph[node]:
+            new_cost = cost + weight
+            if new_cost < dist.get(neighbor, float('inf')):
+                dist[neighbor] = new_cost
+                parent[neighbor] = node
+                heapq.heappush(heaps[side], (new_cost, neighbor))
+                if neighbor in other_dist and new_cost + other_dist[neighbor] < best_cost:
+                    best_cost = new_cost + other_dist[neighbor]
+                    meet = neighbor
 
-    try:
-        ids_path, ids_nodes, ids_time, ids_cost = ids(graph, start, goal, max_depth=50)
-        results['IDS'] = {
-            'path_length': len(ids_path) if ids_path else 0,
-            'nodes_generated': ids_nodes,
-            'time': ids_time,
-            'cost': ids_cost,
-            'found': len(ids_path) > 0
+    if meet is None:
+        return [], nodes_generated, time.time() - start_time, float('inf')
+    return join_paths(parents[0], parents[1], meet), nodes_generated, time.time() - start_time, best_cost
+
+
+def adjacency_bitsets(graph):
+    if isinstance(graph, CSRGraph):
+        return graph.adjacency_bits()
+    bitsets = []
+    for node in range(len(graph)):
+        bits = 0
+        for neighbor, _ in graph[node]:
+            bits |= 1 << neighbor
+        bitsets.append(bits)
+    return bitsets
+
+
+def bit_indices(bits, num_nodes):
+    raw = np.frombuffer(bits.to_bytes((num_nodes + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder='little')).tolist()
+
+
+def bitset_bfs(graph, source, goal=None, level_stats=None, alpha=14, beta=24):
+    # direction-optimizing BFS (Beamer et al.): expand top-down while the frontier is small and
+    # switch to bottom-up, where each unvisited node looks for any parent in the frontier, when
+    # the frontier's edges outnumber the unexplored edges / alpha; back to top-down below n / beta
+    adj = adjacency_bitsets(graph)
+    num_nodes = len(graph)
+    degree = [bin(bits).count('1') for bits in adj]
+    parent = [-1] * num_nodes
+    parent[source] = source
+    levels = [[source]]
+    visited = frontier = 1 << source
+    all_nodes = (1 << num_nodes) - 1
+    edges_unexplored = sum(degree) - degree[source]
+    top_down = True
+
+    while frontier and not (goal is not None and (visited >> goal) & 1):
+        frontier_nodes = levels[-1]
+        frontier_edges = sum(degree[node] for node in frontier_nodes)
+        if top_down and frontier_edges > edges_unexplored / alpha:
+            top_down = False
+        elif not top_down and len(frontier_nodes) < num_nodes / beta:
+            top_down = True
+
+        next_frontier = 0
+        if top_down:
+            for node in frontier_nodes:
+                new = adj[node] & ~visited & ~next_frontier
+                if new:
+                    next_frontier |= new
+                    for neighbor in bit_indices(new, num_nodes):
+                        parent[neighbor] = node
+        else:
+            for node in bit_indices(all_nodes & ~visited, num_nodes):
+                hit = adj[node] & frontier
+                if hit:
+                    next_frontier |= 1 << node
+                    parent[node] = (hit & -hit).bit_length() - 1
+
+        if level_stats is not None:
+            level_stats.append({'level': len(levels) - 1, 'frontier_size': len(frontier_nodes),
+                                'direction': 'top-down' if top_down else 'bottom-up'})
+        visited |= next_frontier
+        frontier = next_frontier
+        if frontier:
+            levels.append(bit_indices(frontier, num_nodes))
+            edges_unexplored -= sum(degree[node] for node in levels[-1])
+
+    return parent, levels
+
+
+def direction_optimizing_bfs(graph, start, goal, level_stats=None):
+    start_time = time.time()
+    parent, levels = bitset_bfs(graph, start, goal, level_stats)
+    nodes_generated = sum(len(level) for level in levels)
+    if parent[goal] < 0:
+        return [], nodes_generated, time.time() - start_time, float('inf')
+
+    path = [goal]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path, nodes_generated, time.time() - start_time, calculate_path_cost(graph, path)
+
+
+def bfs_all_distances(graph, source, level_stats=None):
+    # unweighted hop distance from source to every node, -1 if unreachable
+    _, levels = bitset_bfs(graph, source, level_stats=level_stats)
+    dist = [-1] * len(graph)
+    for depth, level in enumerate(levels):
+        for node in level:
+            dist[node] = depth
+    return dist
+
+
+def dijkstra_distances(graph, source):
+    dist = [float('inf')] * len(graph)
+    dist[source] = 0
+    pq = [(0, source)]
+    while pq:
+        cost, node = heapq.heappop(pq)
+        if cost > dist[node]:
+            continue
+        for neighbor, weight in graph[node]:
+            new_cost = cost + weight
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                heapq.heappush(pq, (new_cost, neighbor))
+    return dist
+
+
+class Landmarks:
+    def __init__(self, graph, num_landmarks=4, seed=None):
+        rng = random.Random(seed)
+        start_time = time.time()
+        self.nodes = []
+        self.distances = []
+        # farthest-point selection: each new landmark maximises its distance to the ones chosen so far
+        closest = dijkstra_distances(graph, rng.choice(list(graph.keys())))
+        for _ in range(min(num_landmarks, len(graph))):
+            landmark = max(range(len(graph)), key=lambda v: closest[v] if closest[v] != float('inf') else -1)
+            dist = dijkstra_distances(graph, landmark)
+            self.nodes.append(landmark)
+            self.distances.append(dist)
+            closest = [min(a, b) for a, b in zip(closest, dist)] if len(self.nodes) > 1 else dist
+        self.build_time = time.time() - start_time
+
+
+def alt_astar(graph, start, goal, landmarks):
+    goal_dists = [(dist[goal], dist) for dist in landmarks.distances]
+
+    def heuristic(node):
+        # triangle inequality: |d(L, goal) - d(L, node)| <= d(node, goal) for every landmark L
+        best = 0
+        for goal_dist, dist in goal_dists:
+            bound = abs(goal_dist - dist[node])
+            if bound > best:
+                best = bound
+        return best
+
+    parent = {}
+    g_cost = {start: 0}
+    pq = [(heuristic(start), 0, start, -1)]
+    nodes_generated = 0
+    start_time = time.time()
+
+    while pq:
+        _, cost, node, prev = heapq.heappop(pq)
+        nodes_generated += 1
+        if node in parent or cost > g_cost[node]:
+            continue
+        parent[node] = prev if prev >= 0 else None
+
+        if node == goal:
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
+
+        for neighbor, weight in graph[node]:
+            new_cost = cost + weight
+            if neighbor not in parent and new_cost < g_cost.get(neighbor, float('inf')):
+                g_cost[neighbor] = new_cost
+                heapq.heappush(pq, (new_cost + heuristic(neighbor), new_cost, neighbor, node))
+
+    return [], nodes_generated, time.time() - start_time, float('inf')
+
+
+class ShortestPathTree:
+    def __init__(self, source):
+        self.source = source
+        self.dist = {source: 0}
+        self.parent = {source: None}
+        self.settled = set()
+        self.heap = [(0, source)]
+
+    @property
+    def complete(self):
+        return not self.heap
+
+    def grow(self, graph, goal=None):
+        # resume Dijkstra from the saved frontier until goal is settled (or the tree is complete)
+        settled, dist, parent, heap = self.settled, self.dist, self.parent, self.heap
+        nodes_generated = 0
+        while heap and goal not in settled:
+            cost, node = heapq.heappop(heap)
+            nodes_generated += 1
+            if node in settled:
+                continue
+            settled.add(node)
+            for neighbor, weight in graph[node]:
+                new_cost = cost + weight
+                if new_cost < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = new_cost
+                    parent[neighbor] = node
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return nodes_generated
+
+
+class ShortestPathTreeCache:
+    def __init__(self, graph, max_trees=32):
+        self.graph = graph
+        self.max_trees = max_trees
+        self.trees = OrderedDict()
+        self.hits = 0
+        self.resumes = 0
+        self.misses = 0
+
+    def tree(self, source):
+        tree = self.trees.get(source)
+        if tree is None:
+            self.misses += 1
+            tree = self.trees[source] = ShortestPathTree(source)
+            if len(self.trees) > self.max_trees:
+                self.trees.popitem(last=False)
+        else:
+            self.trees.move_to_end(source)
+        return tree
+
+    def query(self, start, goal):
+        start_time = time.time()
+        cached = start in self.trees
+        tree = self.tree(start)
+        if cached:
+            if goal in tree.settled:
+                self.hits += 1
+            else:
+                self.resumes += 1
+        nodes_generated = tree.grow(self.graph, goal)
+
+        if goal not in tree.settled:
+            return [], nodes_generated, time.time() - start_time, float('inf')
+        return reconstruct_path(tree.parent, goal), nodes_generated, time.time() - start_time, tree.dist[goal]
+
+    def distances_from(self, source):
+        tree = self.tree(source)
+        tree.grow(self.graph)
+        return tree.dist
+
+    def stats(self):
+        lookups = self.hits + self.resumes + self.misses
+        return {
+            'hits': self.hits,
+            'resumes': self.resumes,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.resumes) / lookups * 100 if lookups else 0.0,
+            'trees': len(self.trees),
         }
-    except Exception as e:
-        print(f"IDS failed: {e}")
-        results['IDS'] = {'path_length': 0, 'nodes_generated': 0, 'time': 0, 'cost': float('inf'), 'found': False}
+
+
+class ContractionHierarchy:
+    def __init__(self, graph, witness_limit=64, max_core_degree=16):
+        start_time = time.time()
+        num_nodes = len(graph)
+        adj = [{} for _ in range(num_nodes)]
+        for node in range(num_nodes):
+            for neighbor, weight in graph[node]:
+                if neighbor != node and weight < adj[node].get(neighbor, float('inf')):
+                    adj[node][neighbor] = weight
+        num_edges = sum(len(edges) for edges in adj) // 2
+        self.witness_limit = witness_limit
+        self.rank = [0] * num_nodes
+        self.up = [None] * num_nodes
+        self.middle = {}
+        self.num_shortcuts = 0
+        self.core_size = 0
+
+        # contract nodes in increasing edge-difference order, re-checking priorities lazily on pop.
+        # Contracting a node costs degree^2 witness searches and adds about as many shortcuts, so once
+        # the remaining graph averages more than max_core_degree neighbors it is left as an
+        # uncontracted core that queries cross with plain bidirectional Dijkstra
+        deleted_neighbors = [0] * num_nodes
+        heap = []
+        if 2 * num_edges <= max_core_degree * num_nodes:
+            heap = [(len(self.shortcuts(adj, node)) - len(adj[node]), node) for node in range(num_nodes)]
+            heapq.heapify(heap)
+        order = 0
+        while heap and 2 * num_edges <= max_core_degree * (num_nodes - order):
+            _, node = heapq.heappop(heap)
+            shortcuts = self.shortcuts(adj, node)
+            priority = len(shortcuts) - len(adj[node]) + deleted_neighbors[node]
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, node))
+                continue
+
+            for u, w, cost in shortcuts:
+                if cost < adj[u].get(w, float('inf')):
+                    if w not in adj[u]:
+                        num_edges += 1
+                    adj[u][w] = adj[w][u] = cost
+                    self.middle[(u, w)] = self.middle[(w, u)] = node
+                    self.num_shortcuts += 1
+            num_edges -= len(adj[node])
+            for neighbor in adj[node]:
+                del adj[neighbor][node]
+                deleted_neighbors[neighbor] += 1
+            # every neighbor still in the graph is contracted later, i.e. ranks higher
+            self.up[node] = list(adj[node].items())
+            adj[node] = None
+            self.rank[node] = order
+            order += 1
+
+        # core nodes share the top rank and keep all their core edges, in both directions
+        for node in range(num_nodes):
+            if adj[node] is not None:
+                self.up[node] = list(adj[node].items())
+                self.rank[node] = order
+                self.core_size += 1
+        self.build_time = time.time() - start_time
+
+    def shortcuts(self, adj, node):
+        neighbors = list(adj[node].items())
+        needed = []
+        for i, (u, weight_u) in enumerate(neighbors):
+            targets = {w: weight_u + weight_w for w, weight_w in neighbors[i + 1:]}
+            if not targets:
+                continue
+            witness = self.witness_search(adj, u, node, max(targets.values()))
+            for w, cost in targets.items():
+                if witness.get(w, float('inf')) > cost:
+                    needed.append((u, w, cost))
+        return needed
+
+    def witness_search(self, adj, source, excluded, max_cost):
+        # bounded Dijkstra that avoids the node being contracted
+        dist = {source: 0}
+        pq = [(0, source)]
+        settled = 0
+        while pq and settled < self.witness_limit:
+            cost, node = heapq.heappop(pq)
+            if cost > max_cost:
+                break
+            if cost > dist[node]:
+                continue
+            settled += 1
+            for neighbor, weight in adj[node].items():
+                new_cost = cost + weight
+                if neighbor != excluded and new_cost < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = new_cost
+                    heapq.heappush(pq, (new_cost, neighbor))
+        return dist
+
+    def unpack(self, path):
+        # expand every shortcut edge back into the original edges it stands for
+        result = [path[0]]
+        for u, w in zip(path, path[1:]):
+            stack = [(u, w)]
+            while stack:
+                a, b = stack.pop()
+                mid = self.middle.get((a, b))
+                if mid is None:
+                    result.append(b)
+                else:
+                    stack.append((mid, b))
+                    stack.append((a, mid))
+        return result
+
+
+def ch_search(hierarchy, start, goal):
+    # upward searches from both ends; inside the core they relax every core edge, which the
+    # min-of-both-frontiers stopping rule below keeps exact (it is plain bidirectional Dijkstra there)
+    start_time = time.time()
+    up = hierarchy.up
+    dists = [{start: 0}, {goal: 0}]
+    parents = [{start: None}, {goal: None}]
+    heaps = [[(0, start)], [(0, goal)]]
+    best_cost = float('inf')
+    meet = None
+    nodes_generated = 0
+
+    while heaps[0] or heaps[1]:
+        tops = [heap[0][0] if heap else float('inf') for heap in heaps]
+        side = 0 if tops[0] <= tops[1] else 1
+        if tops[side] >= best_cost:
+            break
+        dist, other_dist = dists[side], dists[1 - side]
+        cost, node = heapq.heappop(heaps[side])
+        nodes_generated += 1
+        if cost > dist[node]:
+            continue
+        if node in other_dist and cost + other_dist[node] < best_cost:
+            best_cost = cost + other_dist[node]
+            meet = node
+
+        for neighbor, weight in up[node]:
+            new_cost = cost + weight
+            if new_cost < dist.get(neighbor, float('inf')):
+                dist[neighbor] = new_cost
+                parents[side][neighbor] = node
+                heapq.heappush(heaps[side], (new_cost, neighbor))
+
+    if meet is None:
+        return [], nodes_generated, time.time() - start_time, float('inf')
+    path = hierarchy.unpack(join_paths(parents[0], parents[1], meet))
+    return path, nodes_generated, time.time() - start_time, best_cost
+
+
+def iter_ids(graph, start, goal, max_depth=50, depth_stats=None, events=True, max_nodes=None, max_time=None,
+             cancel=None):
+    watched = events or max_nodes is not None or max_time is not None or cancel is not None
+    start_time = time.time()
+    nodes_generated = 0
+    if start == goal:
+        return [start], nodes_generated, time.time() - start_time, 0
+
+    on_path = bytearray(len(graph))
+    for depth in range(max_depth):
+        depth_start = time.time()
+        iteration_nodes = 0
+        cutoff = False
+        # path/costs are shared buffers; stack[i] iterates the neighbors of path[i]
+        path = [start]
+        costs = [0]
+        on_path[start] = 1
+        stack = [iter(graph[start])] if depth > 0 else []
+        while stack:
+            for neighbor, weight in stack[-1]:
+                if not on_path[neighbor]:
+                    break
+            else:
+                stack.pop()
+                on_path[path.pop()] = 0
+                costs.pop()
+                continue
+
+            iteration_nodes += 1
+            if watched:
+                if events:
+                    yield ExpansionEvent(neighbor, len(path), costs[-1] + weight, len(stack),
+                                         nodes_generated + iteration_nodes)
+                reason = stop_reason(nodes_generated + iteration_nodes, start_time, max_nodes, max_time, cancel)
+                if reason:
+                    yield SearchStopped(reason, nodes_generated + iteration_nodes)
+                    return [], nodes_generated + iteration_nodes, time.time() - start_time, float('inf')
+            if neighbor == goal:
+                path.append(neighbor)
+                for node in path:
+                    on_path[node] = 0
+                nodes_generated += iteration_nodes
+                if depth_stats is not None:
+                    depth_stats.append({'depth': depth, 'nodes_generated': iteration_nodes,
+                                        'time': time.time() - depth_start})
+                return path, nodes_generated, time.time() - start_time, costs[-1] + weight
+            if len(path) < depth:
+                path.append(neighbor)
+                costs.append(costs[-1] + weight)
+                on_path[neighbor] = 1
+                stack.append(iter(graph[neighbor]))
+            else:
+                cutoff = True
+
+        nodes_generated += iteration_nodes
+        if depth_stats is not None:
+            depth_stats.append({'depth': depth, 'nodes_generated': iteration_nodes, 'time': time.time() - depth_start})
+        if depth > 0 and not cutoff:
+            # the whole component was explored without reaching the depth limit
+            break
+
+    return [], nodes_generated, time.time() - start_time, float('inf')
+
+
+def ids(graph, start, goal, max_depth=50, depth_stats=None):
+    return run_search(iter_ids(graph, start, goal, max_depth, depth_stats, events=False))
+
+
+ALGORITHMS = {
+    'BFS': bfs,
+    'DFS': dfs,
+    'UCS': ucs,
+    'UCS-Dial': ucs_dial,
+    'BiBFS': bidirectional_bfs,
+    'DO-BFS': direction_optimizing_bfs,
+    'BiUCS': bidirectional_ucs,
+    'IDS': lambda graph, start, goal: ids(graph, start, goal, max_depth=50),
+}
+
+
+def run_single_test(graph, start, goal, algorithms=None):
+    if algorithms is None:
+        algorithms = ALGORITHMS
+    results = {}
+    for algo, search in algorithms.items():
+        try:
+            path, nodes, elapsed, cost = search(graph, start, goal)
+            results[algo] = {
+                'path_length': len(path) if path else 0,
+                'nodes_generated': nodes,
+                'time': elapsed,
+                'cost': cost,
+                'found': len(path) > 0
+            }
+        except Exception as e:
+            print(f"{algo} failed: {e}")
+            results[algo] = {'path_length': 0, 'nodes_generated': 0, 'time': 0, 'cost': float('inf'), 'found': False}
 
     return results
 
 
-def run_multiple_tests(graph, num_tests=10):
-    all_results = {
-        'BFS': {'path_lengths': [], 'nodes_generated': [], 'times': [], 'costs': [], 'success_rate': 0},
-        'DFS': {'path_lengths': [], 'nodes_generated': [], 'times': [], 'costs': [], 'success_rate': 0},
-        'UCS': {'path_lengths': [], 'nodes_generated': [], 'times': [], 'costs': [], 'success_rate': 0},
-        'IDS': {'path_lengths': [], 'nodes_generated': [], 'times': [], 'costs': [], 'success_rate': 0}
-    }
+def random_pair(num_nodes, seed=None, test_num=0):
+    # with a seed every pair is reproducible on its own, whichever process draws it
+    rng = random.Random(f"{seed}:{test_num}") if seed is not None else random
+    start = rng.randrange(num_nodes)
+    goal = rng.randrange(num_nodes - 1)
+    if goal >= start:
+        goal += 1
+    return start, goal
 
-    nodes = list(graph.keys())
-    successful_tests = 0
 
-    print(f"Running {num_tests} tests with random start-goal pairs...")
+def new_results_table(algorithms):
+    return {
+        algo: {'path_lengths': [], 'nodes_generated': [], 'times': [], 'costs': [], 'success_rate': 0}
+        for algo in algorithms
+    }
 
-    for test_num in range(num_tests):
-        start = random.choice(nodes)
-        goal = random.choice([n for n in nodes if n != start])
 
-        print(f"Test {test_num + 1}/{num_tests}: Start={start}, Goal={goal}")
-        test_results = run_single_test(graph, start, goal)
-        # Check if at least one algorithm found a solution
-        if any(result['found'] for result in test_results.values()):
-            successful_tests += 1
+def record_test(all_results, test_results):
+    # Check if at least one algorithm found a solution
+    if not any(result['found'] for result in test_results.values()):
+        return False
+
+    for algo, result in test_results.items():
+        if result['found']:
+            all_results[algo]['path_lengths'].append(result['path_length'])
+            all_results[algo]['nodes_generated'].append(result['nodes_generated'])
+            all_results[algo]['times'].append(result['time'])
+            all_results[algo]['costs'].append(result['cost'])
+    return True
 
-            for algo, result in test_results.items():
-                if result['found']:
-                    all_results[algo]['path_lengths'].append(result['path_length'])
-                    all_results[algo]['nodes_generated'].append(result['nodes_generated'])
-                    all_results[algo]['times'].append(result['time'])
-                    all_results[algo]['costs'].append(result['cost'])
 
+def summarize_results(all_results, num_tests):
     for algo in all_results:
         successful_runs = len(all_results[algo]['path_lengths'])
         all_results[algo]['success_rate'] = (successful_runs / num_tests) * 100
@@ -253,33 +1053,187 @@ def run_multiple_tests(graph, num_tests=10):
             all_results[algo]['avg_time'] = 0
             all_results[algo]['avg_cost'] = float('inf')
 
-    return all_results, successful_tests
+    return all_results
 
-if __name__ == "__main__":
-    NUM_NODES = 1000
-    NUM_TESTS = 10
-
-    print("Generating connected dense graph...")
-    attempts = 0
-    while True:
-        attempts += 1
-        graph = generate_dense_graph(NUM_NODES, density=0.8)
-        if is_connected(graph):
-            print(f"Connected graph generated after {attempts} attempt(s)")
-            break
-        print(f"Attempt {attempts}: Graph not connected, regenerating...")
 
-        if attempts > 50:
-            print("Warning: Too many attempts, reducing density...")
-            graph = generate_dense_graph(NUM_NODES, density=0.9)
-            if is_connected(graph):
-                break
+def run_multiple_tests(graph, num_tests=10, algorithms=None, seed=None):
+    if algorithms is None:
+        algorithms = ALGORITHMS
+    all_results = new_results_table(algorithms)
+    successful_tests = 0
+
+    print(f"Running {num_tests} tests with random start-goal pairs...")
+
+    for test_num in range(num_tests):
+        start, goal = random_pair(len(graph), seed, test_num)
+
+        print(f"Test {test_num + 1}/{num_tests}: Start={start}, Goal={goal}")
+        test_results = run_single_test(graph, start, goal, algorithms)
+        if record_test(all_results, test_results):
+            successful_tests += 1
+
+    return summarize_results(all_results, num_tests), successful_tests
+
+
+def share_graph(graph):
+    blocks = []
+    spec = {}
+    for field in ('offsets', 'neighbors', 'weights'):
+        data = getattr(graph, field)
+        block = shared_memory.SharedMemory(create=True, size=max(data.nbytes, 1))
+        np.ndarray(data.shape, dtype=data.dtype, buffer=block.buf)[:] = data
+        blocks.append(block)
+        spec[field] = (block.name, data.shape, data.dtype.str)
+    return blocks, spec
+
+
+def attach_graph(spec):
+    blocks = []
+    arrays = {}
+    for field, (name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[field] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return CSRGraph(arrays['offsets'], arrays['neighbors'], arrays['weights']), blocks
+
+
+worker_state = {}
+
+
+def init_worker(spec):
+    worker_state['graph'], worker_state['blocks'] = attach_graph(spec)
+
+
+def run_test_pair(task):
+    test_num, seed, algorithm_names = task
+    graph = worker_state['graph']
+    start, goal = random_pair(len(graph), seed, test_num)
+    algorithms = {algo: ALGORITHMS[algo] for algo in algorithm_names}
+    return test_num, start, goal, run_single_test(graph, start, goal, algorithms)
+
+
+def run_multiple_tests_parallel(graph, num_tests=10, algorithm_names=None, seed=0, workers=None):
+    if algorithm_names is None:
+        algorithm_names = list(ALGORITHMS)
+    all_results = new_results_table(algorithm_names)
+    successful_tests = 0
+    workers = workers or os.cpu_count()
+
+    print(f"Running {num_tests} tests with random start-goal pairs on {workers} worker(s)...")
+
+    blocks, spec = share_graph(graph)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(spec,)) as pool:
+            tasks = [(test_num, seed, algorithm_names) for test_num in range(num_tests)]
+            chunksize = max(1, num_tests // (workers * 4))
+            for test_num, start, goal, test_results in pool.map(run_test_pair, tasks, chunksize=chunksize):
+                print(f"Test {test_num + 1}/{num_tests}: Start={start}, Goal={goal}")
+                if record_test(all_results, test_results):
+                    successful_tests += 1
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return summarize_results(all_results, num_tests), successful_tests
+
+
+def percentile(sorted_values, pct):
+    # linear interpolation between closest ranks
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lo = int(rank)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (rank - lo)
+
+
+def benchmark(graph, pairs, algorithms=None, warmup=1, repeats=5):
+    if algorithms is None:
+        algorithms = ALGORITHMS
+    rows = []
+    for algo, search in algorithms.items():
+        samples_ns = []
+        total_nodes = 0
+        found = 0
+        for start, goal in pairs:
+            for _ in range(warmup):
+                search(graph, start, goal)
+            gc.collect()
+            gc.disable()
+            try:
+                for _ in range(repeats):
+                    t0 = time.perf_counter_ns()
+                    path, nodes, _, _ = search(graph, start, goal)
+                    samples_ns.append(time.perf_counter_ns() - t0)
+                    total_nodes += nodes
+                    found += bool(path)
+            finally:
+                gc.enable()
 
-    results, successful_tests = run_multiple_tests(graph, NUM_TESTS)
+        samples_ns.sort()
+        total_ns = sum(samples_ns)
+        runs = len(samples_ns)
+        rows.append({
+            'algorithm': algo,
+            'runs': runs,
+            'found': found,
+            'median_ms': percentile(samples_ns, 50) / 1e6,
+            'p95_ms': percentile(samples_ns, 95) / 1e6,
+            'p99_ms': percentile(samples_ns, 99) / 1e6,
+            'mean_ms': total_ns / runs / 1e6 if runs else 0.0,
+            'min_ms': samples_ns[0] / 1e6 if runs else 0.0,
+            'max_ms': samples_ns[-1] / 1e6 if runs else 0.0,
+            'avg_nodes_generated': total_nodes / runs if runs else 0.0,
+            'expansions_per_s': total_nodes / (total_ns / 1e9) if total_ns else 0.0,
+        })
+    return rows
 
+
+def benchmark_metadata(graph, args):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    num_nodes = len(graph)
+    max_edges = num_nodes * (num_nodes - 1) / 2
+    return {
+        'commit': commit,
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'nodes': num_nodes,
+        'edges': graph.num_edges,
+        # measured from the graph, so a --load'ed file is described by what it holds
+        'density': graph.num_edges / max_edges if max_edges else 0.0,
+        'graph_file': args.load,
+        'seed': args.seed,
+        'pairs': args.tests,
+        'warmup': args.warmup,
+        'repeats': args.repeats,
+    }
+
+
+def write_benchmark_json(rows, metadata, path):
+    with open(path, "w") as f:
+        json.dump({'metadata': metadata, 'results': rows}, f, indent=2)
+
+
+def write_benchmark_csv(rows, metadata, path):
+    fields = ['commit', 'nodes', 'edges', 'density', 'seed', 'warmup', 'repeats'] + list(rows[0])
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**{key: metadata[key] for key in fields if key in metadata}, **row})
+
+
+def print_summary_table(results, successful_tests):
     table_data = []
-    for algo in ['BFS', 'DFS', 'UCS', 'IDS']:
-        result = results[algo]
+    for algo, result in results.items():
         table_data.append([
             algo,
             f"{result['avg_path_length']:.1f}",
@@ -294,3 +1248,139 @@ if __name__ == "__main__":
         table_data,
         headers=["Algorithm", "Avg Path Length", "Avg Nodes Generated", "Avg Cost", "Avg Time", "Success Rate"]
     ))
+
+
+def print_benchmark_table(rows):
+    print(f"\nBenchmark ({rows[0]['runs']} timed runs per algorithm):")
+    print(tabulate(
+        [[row['algorithm'], f"{row['median_ms']:.3f}", f"{row['p95_ms']:.3f}", f"{row['p99_ms']:.3f}",
+          f"{row['mean_ms']:.3f}", f"{row['avg_nodes_generated']:.0f}", f"{row['expansions_per_s']:,.0f}"]
+         for row in rows],
+        headers=["Algorithm", "Median ms", "p95 ms", "p99 ms", "Mean ms", "Avg Nodes Generated", "Expansions/s"]
+    ))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare graph search algorithms on a random dense graph.")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--density", type=float, default=0.8)
+    parser.add_argument("--tests", type=int, default=10)
+    parser.add_argument("--load", help="memory-map a graph saved with --save instead of generating one")
+    parser.add_argument("--save", help="write the generated graph to this binary file")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=0,
+                        help="run the start/goal pairs on a process pool (0 = sequential)")
+    parser.add_argument("--ids-stats", action="store_true",
+                        help="print nodes generated per IDS depth iteration for the first start/goal pair")
+    parser.add_argument("--ch", action="store_true",
+                        help="build a contraction hierarchy and add the CH query to the comparison")
+    parser.add_argument("--bfs-levels", action="store_true",
+                        help="print the direction-optimizing BFS levels from the first start node")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="time every algorithm with perf_counter_ns over warmup + repeated runs per pair")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", help="write benchmark results to this JSON file")
+    parser.add_argument("--csv", help="write benchmark results to this CSV file")
+    args = parser.parse_args()
+    if args.benchmark and args.workers:
+        parser.error("--benchmark times every run in this process; it cannot be combined with --workers")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    NUM_NODES = args.nodes
+    NUM_TESTS = args.tests
+
+    if args.load:
+        setup_start = time.time()
+        graph = load_graph(args.load)
+        print(f"Loaded graph from {args.load} in {time.time() - setup_start:.4f}s")
+        print(f"CSR graph: {len(graph)} nodes, {graph.num_edges} edges, {graph.nbytes / 1024:.1f} KB")
+    else:
+        print("Generating connected dense graph...")
+        setup_start = time.time()
+        attempts = 0
+        while True:
+            attempts += 1
+            seed = None if args.seed is None else args.seed + attempts
+            graph = generate_dense_csr_graph(NUM_NODES, density=args.density, seed=seed)
+            if is_connected(graph):
+                print(f"Connected graph generated after {attempts} attempt(s) in {time.time() - setup_start:.4f}s")
+                print(f"CSR graph: {len(graph)} nodes, {graph.num_edges} edges, {graph.nbytes / 1024:.1f} KB")
+                break
+            print(f"Attempt {attempts}: Graph not connected, regenerating...")
+
+            if attempts > 50:
+                print("Warning: Too many attempts, reducing density...")
+                graph = generate_dense_csr_graph(NUM_NODES, density=0.9, seed=seed)
+                if is_connected(graph):
+                    break
+
+    if args.save:
+        save_graph(graph, args.save)
+        print(f"Graph saved to {args.save}")
+
+    spt_cache = None
+    if args.workers:
+        # ALT and the tree cache hold per-process state, so the pool runs the stateless registry only
+        results, successful_tests = run_multiple_tests_parallel(
+            graph, NUM_TESTS, seed=0 if args.seed is None else args.seed, workers=args.workers
+        )
+        print_summary_table(results, successful_tests)
+    else:
+        print("Precomputing ALT landmarks...")
+        landmarks = Landmarks(graph, num_landmarks=4, seed=args.seed)
+        print(f"Landmarks {landmarks.nodes} built in {landmarks.build_time:.4f}s")
+        algorithms = dict(ALGORITHMS, ALT=lambda graph, start, goal: alt_astar(graph, start, goal, landmarks))
+        if args.ch:
+            print("Building contraction hierarchy...")
+            hierarchy = ContractionHierarchy(graph)
+            print(f"Contraction hierarchy built in {hierarchy.build_time:.4f}s with {hierarchy.num_shortcuts} shortcuts"
+                  f" and a {hierarchy.core_size}-node uncontracted core")
+            algorithms['CH'] = lambda graph, start, goal: ch_search(hierarchy, start, goal)
+
+        if args.benchmark:
+            # the tree cache is left out: repeated runs of one pair would only measure cache hits
+            pairs = [random_pair(len(graph), args.seed, test_num) for test_num in range(NUM_TESTS)]
+            rows = benchmark(graph, pairs, algorithms, warmup=args.warmup, repeats=args.repeats)
+            print_benchmark_table(rows)
+            metadata = benchmark_metadata(graph, args)
+            if args.json:
+                write_benchmark_json(rows, metadata, args.json)
+                print(f"Benchmark results written to {args.json}")
+            if args.csv:
+                write_benchmark_csv(rows, metadata, args.csv)
+                print(f"Benchmark results written to {args.csv}")
+        else:
+            spt_cache = ShortestPathTreeCache(graph, max_trees=32)
+            algorithms['UCS-Cache'] = lambda graph, start, goal: spt_cache.query(start, goal)
+
+            results, successful_tests = run_multiple_tests(graph, NUM_TESTS, algorithms, seed=args.seed)
+            print_summary_table(results, successful_tests)
+
+    if spt_cache is not None:
+        cache_stats = spt_cache.stats()
+        print(f"\nShortest-path-tree cache: {cache_stats['hits']} hits, {cache_stats['resumes']} resumed, "
+              f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.1f}% reuse, {cache_stats['trees']} trees cached)")
+
+    if args.ids_stats:
+        start, goal = random_pair(len(graph), args.seed, 0)
+        depth_stats = []
+        ids(graph, start, goal, max_depth=50, depth_stats=depth_stats)
+        print(f"\nIDS iterations for Start={start}, Goal={goal}:")
+        print(tabulate(
+            [[row['depth'], row['nodes_generated'], f"{row['time']:.6f}s"] for row in depth_stats],
+            headers=["Depth Limit", "Nodes Generated", "Time"]
+        ))
+
+    if args.bfs_levels:
+        start, _ = random_pair(len(graph), args.seed, 0)
+        level_stats = []
+        dist = bfs_all_distances(graph, start, level_stats)
+        print(f"\nBFS levels from {start} ({sum(d >= 0 for d in dist)} nodes reached, eccentricity {max(dist)}):")
+        print(tabulate(
+            [[row['level'], row['frontier_size'], row['direction']] for row in level_stats],
+            headers=["Level", "Frontier Size", "Direction"]
+        ))
@@ -14,89 +14,129 @@ def generate_dense_graph(num_nodes, min_weight=1, max_weight=10, density=0.7):
                 graph[j].append((i, weight))
     return graph
 
+def reconstruct_path(parent, goal):
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
 def bfs(graph, start, goal):
-    visited = set()
-    queue = deque([(start, [start])])
+    parent = {}
+    queue = deque([(start, None, 0)])
     nodes_generated = 0
     start_time = time.time()
     while queue:
-        node, path = queue.popleft()
+        node, prev, cost = queue.popleft()
         nodes_generated += 1
 
         if node == goal:
-            return path, nodes_generated, time.time() - start_time
+            parent[node] = prev
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
 
-        if node not in visited:
-            visited.add(node)
-            for neighbor, _ in graph[node]:
-                if neighbor not in visited:
-                    queue.append((neighbor, path + [neighbor]))
-    return [], nodes_generated, time.time() - start_time
+        if node not in parent:
+            parent[node] = prev
+            for neighbor, weight in graph[node]:
+                if neighbor not in parent:
+                    queue.append((neighbor, node, cost + weight))
+    return [], nodes_generated, time.time() - start_time, float('inf')
 
 def dfs(graph, start, goal):
-    visited = set()
-    stack = [(start, [start])]
+    parent = {}
+    stack = [(start, None, 0)]
     nodes_generated = 0
     start_time = time.time()
 
     while stack:
-        node, path = stack.pop()
+        node, prev, cost = stack.pop()
         nodes_generated += 1
 
         if node == goal:
-            return path, nodes_generated, time.time() - start_time
-
-        if node not in visited:
-            visited.add(node)
-            for neighbor, _ in reversed(graph[node]):
-                if neighbor not in visited:
-                    stack.append((neighbor, path + [neighbor]))
-    return [], nodes_generated, time.time() - start_time
+            parent[node] = prev
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
+
+        if node not in parent:
+            parent[node] = prev
+            for neighbor, weight in reversed(graph[node]):
+                if neighbor not in parent:
+                    stack.append((neighbor, node, cost + weight))
+    return [], nodes_generated, time.time() - start_time, float('inf')
 
 def ucs(graph, start, goal):
-    visited = set()
-    pq = [(0, start, [start])]
+    parent = {}
+    pq = [(0, start, -1)]
     nodes_generated = 0
     start_time = time.time()
 
     while pq:
-        cost, node, path = heapq.heappop(pq)
+        cost, node, prev = heapq.heappop(pq)
         nodes_generated += 1
 
         if node == goal:
-            return path, nodes_generated, time.time() - start_time, cost
+            parent[node] = prev if prev >= 0 else None
+            return reconstruct_path(parent, node), nodes_generated, time.time() - start_time, cost
 
-        if node not in visited:
-            visited.add(node)
+        if node not in parent:
+            parent[node] = prev if prev >= 0 else None
             for neighbor, weight in graph[node]:
-                if neighbor not in visited:
-                    heapq.heappush(pq, (cost + weight, neighbor, path + [neighbor]))
+                if neighbor not in parent:
+                    heapq.heappush(pq, (cost + weight, neighbor, node))
     return [], nodes_generated, time.time() - start_time, float('inf')
 
-def dls(graph, node, goal, limit, path, nodes_generated):
-    if node == goal:
-        return path, True, nodes_generated
-    if limit <= 0:
-        return None, False, nodes_generated
-
-    for neighbor, _ in graph[node]:
-        if neighbor not in path:  # only path-based cycle detection
-            nodes_generated += 1
-            new_path, found, nodes_generated = dls(
-                graph, neighbor, goal, limit - 1, path + [neighbor], nodes_generated
-            )
-            if found:
-                return new_path, True, nodes_generated
-    return None, False, nodes_generated
-
-def ids(graph, start, goal, max_depth=50):
+def ids(graph, start, goal, max_depth=50, depth_stats=None):
     start_time = time.time()
     nodes_generated = 0
+    if start == goal:
+        return [start], nodes_generated, time.time() - start_time, 0
+
+    on_path = bytearray(len(graph))
     for depth in range(max_depth):
-        path, found, nodes_generated = dls(graph, start, goal, depth, [start], nodes_generated)
-        if found:
-            return path, nodes_generated, time.time() - start_time
-    return [], nodes_generated, time.time() - start_time
+        depth_start = time.time()
+        iteration_nodes = 0
+        cutoff = False
+        # path/costs are shared buffers; stack[i] iterates the neighbors of path[i]
+        path = [start]
+        costs = [0]
+        on_path[start] = 1
+        stack = [iter(graph[start])] if depth > 0 else []
+        while stack:
+            for neighbor, weight in stack[-1]:
+                if not on_path[neighbor]:
+                    break
+            else:
+                stack.pop()
+                on_path[path.pop()] = 0
+                costs.pop()
+                continue
+
+            iteration_nodes += 1
+            if neighbor == goal:
+                path.append(neighbor)
+                for node in path:
+                    on_path[node] = 0
+                nodes_generated += iteration_nodes
+                if depth_stats is not None:
+                    depth_stats.append({'depth': depth, 'nodes_generated': iteration_nodes,
+                                        'time': time.time() - depth_start})
+                return path, nodes_generated, time.time() - start_time, costs[-1] + weight
+            if len(path) < depth:
+                path.append(neighbor)
+                costs.append(costs[-1] + weight)
+                on_path[neighbor] = 1
+                stack.append(iter(graph[neighbor]))
+            else:
+                cutoff = True
+
+        nodes_generated += iteration_nodes
+        if depth_stats is not None:
+            depth_stats.append({'depth': depth, 'nodes_generated': iteration_nodes, 'time': time.time() - depth_start})
+        if depth > 0 and not cutoff:
+            # the whole component was explored without reaching the depth limit
+            break
+
+    return [], nodes_generated, time.time() - start_time, float('inf')
 
 if __name__ == "__main__":
     NUM_NODES = 1000
@@ -108,17 +148,17 @@ if __name__ == "__main__":
 
     results = []
 
-    bfs_path, bfs_nodes, bfs_time = bfs(graph, START_NODE, GOAL_NODE)
-    results.append(["BFS", f"{bfs_path[:3]}...{bfs_path[-1:]}", bfs_nodes, "-", bfs_time])
+    bfs_path, bfs_nodes, bfs_time, bfs_cost = bfs(graph, START_NODE, GOAL_NODE)
+    results.append(["BFS", f"{bfs_path[:3]}...{bfs_path[-1:]}", bfs_nodes, bfs_cost, bfs_time])
 
-    dfs_path, dfs_nodes, dfs_time = dfs(graph, START_NODE, GOAL_NODE)
-    results.append(["DFS", f"{dfs_path[:3]}...{dfs_path[-1:]}", dfs_nodes, "-", dfs_time])
+    dfs_path, dfs_nodes, dfs_time, dfs_cost = dfs(graph, START_NODE, GOAL_NODE)
+    results.append(["DFS", f"{dfs_path[:3]}...{dfs_path[-1:]}", dfs_nodes, dfs_cost, dfs_time])
 
     ucs_path, ucs_nodes, ucs_time, ucs_cost = ucs(graph, START_NODE, GOAL_NODE)
     results.append(["UCS", f"{ucs_path[:3]}...{ucs_path[-1:]}", ucs_nodes, ucs_cost, ucs_time])
 
-    ids_path, ids_nodes, ids_time = ids(graph, START_NODE, GOAL_NODE, max_depth=50)
-    results.append(["IDS", f"{ids_path[:3]}...{ids_path[-1:]}", ids_nodes, "-", ids_time])
+    ids_path, ids_nodes, ids_time, ids_cost = ids(graph, START_NODE, GOAL_NODE, max_depth=50)
+    results.append(["IDS", f"{ids_path[:3]}...{ids_path[-1:]}", ids_nodes, ids_cost, ids_time])
 
     print("\nSearch Algorithm Performance:")
     print(tabulate(
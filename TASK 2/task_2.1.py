@@ -1,133 +1,813 @@
-import heapq, math, time, tracemalloc, pandas as pd
-
-goal_state = [[1,2,3],[4,5,6],[7,8,0]]
-
-def to_tuple(state):
-    return tuple(tuple(row) for row in state)
+import argparse, heapq, json, math, mmap, os, shelve, struct, sys, threading, time, tracemalloc, pandas as pd
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 def find_blank(state):
-    for i in range(3):
-        for j in range(3):
+    for i in range(len(state)):
+        for j in range(len(state)):
             if state[i][j] == 0:
                 return i, j
     return None
 
-def manhattan(state):
-    dist = 0
-    for i in range(3):
-        for j in range(3):
-            val = state[i][j]
-            if val != 0:
-                goal_x = (val-1)//3
-                goal_y = (val-1)%3
-                dist += abs(i-goal_x) + abs(j-goal_y)
-    return dist
-
-def neighbors(state):
-    x, y = find_blank(state)
-    moves = []
-    directions = [(1,0),(-1,0),(0,1),(0,-1)]
-    for dx, dy in directions:
-        nx, ny = x+dx, y+dy
-        if 0<=nx<3 and 0<=ny<3:
-            new_state = [row[:] for row in state]
-            new_state[x][y], new_state[nx][ny] = new_state[nx][ny], new_state[x][y]
-            moves.append(new_state)
-    return moves
+def neighbor_cells(size):
+    cells = size * size
+    return [
+        tuple(r * size + c for r, c in ((i // size + dr, i % size + dc) for dr, dc in ((1,0),(-1,0),(0,1),(0,-1)))
+              if 0 <= r < size and 0 <= c < size)
+        for i in range(cells)
+    ]
+
+# Packed N x N states: the tile at cell i lives in bits [bits*i, bits*(i+1)) and the blank's cell
+# index sits above the tiles, so a state is one int and a move is a couple of shifts and adds
+class SlidingPuzzle:
+    def __init__(self, size):
+        self.size = size
+        self.cells = size * size
+        self.bits = max(4, (self.cells - 1).bit_length())
+        self.nibble = (1 << self.bits) - 1
+        self.blank_shift = self.bits * self.cells
+        self.tile_mask = (1 << self.blank_shift) - 1
+        self.moves = neighbor_cells(size)
+        self.manhattan_table = [
+            [0] * self.cells if tile == 0 else
+            [abs(i // size - (tile-1) // size) + abs(i % size - (tile-1) % size) for i in range(self.cells)]
+            for tile in range(self.cells)
+        ]
+        self.goal_row = [0] + [(tile-1) // size for tile in range(1, self.cells)]
+        self.goal_col = [0] + [(tile-1) % size for tile in range(1, self.cells)]
+        self.row_cells = [[r*size + c for c in range(size)] for r in range(size)]
+        self.col_cells = [[r*size + c for r in range(size)] for c in range(size)]
+        self.removals = {}
+        self.goal_tiles = list(range(1, self.cells)) + [0]
+        self.goal_state = [self.goal_tiles[r*size:(r+1)*size] for r in range(size)]
+        self.goal = self.encode(self.goal_state)
+
+    def encode(self, state):
+        code = 0
+        for idx, tile in enumerate(tile for row in state for tile in row):
+            code |= tile << (self.bits*idx)
+            if tile == 0:
+                blank = idx
+        return code | (blank << self.blank_shift)
+
+    def tiles(self, code):
+        return [(code >> (self.bits*i)) & self.nibble for i in range(self.cells)]
+
+    def decode(self, code):
+        tiles = self.tiles(code)
+        return [tiles[r*self.size:(r+1)*self.size] for r in range(self.size)]
+
+    def successors(self, code):
+        bits = self.bits
+        blank = code >> self.blank_shift
+        board = code & self.tile_mask
+        children = []
+        for target in self.moves[blank]:
+            tile = (board >> (bits*target)) & self.nibble
+            # slide the tile into the blank cell; the blank's field is already zero
+            children.append((board - (tile << (bits*target)) + (tile << (bits*blank))) | (target << self.blank_shift))
+        return children
+
+    def manhattan_table_to(self, code):
+        # per-tile, per-cell distances to the cells the tiles occupy in `code` (tables toward any target)
+        size = self.size
+        where = [0] * self.cells
+        for cell, tile in enumerate(self.tiles(code)):
+            where[tile] = cell
+        return [
+            [0] * self.cells if tile == 0 else
+            [abs(i // size - where[tile] // size) + abs(i % size - where[tile] % size) for i in range(self.cells)]
+            for tile in range(self.cells)
+        ]
+
+    def manhattan(self, code, table=None):
+        bits, nibble, table = self.bits, self.nibble, table or self.manhattan_table
+        dist = 0
+        for i in range(self.cells):
+            dist += table[(code >> (bits*i)) & nibble][i]
+        return dist
+
+    def line_conflict(self, code, line, is_row):
+        # 2 moves for every tile that must leave its goal line so the rest end up in goal order
+        home, along = (self.goal_row, self.goal_col) if is_row else (self.goal_col, self.goal_row)
+        seq = []
+        for cell in (self.row_cells[line] if is_row else self.col_cells[line]):
+            tile = (code >> (self.bits*cell)) & self.nibble
+            if tile and home[tile] == line:
+                seq.append(along[tile])
+        if len(seq) < 2:
+            return 0
+        key = tuple(seq)
+        removals = self.removals.get(key)
+        if removals is None:
+            longest = [1] * len(seq)
+            for i in range(len(seq)):
+                for j in range(i):
+                    if seq[j] < seq[i] and longest[j] + 1 > longest[i]:
+                        longest[i] = longest[j] + 1
+            removals = self.removals[key] = len(seq) - max(longest)
+        return 2 * removals
+
+    def linear_conflict(self, code):
+        return sum(self.line_conflict(code, i, True) + self.line_conflict(code, i, False) for i in range(self.size))
+
+    def manhattan_lc(self, code):
+        return self.manhattan(code) + self.linear_conflict(code)
+
+    def successors_h(self, code, h, linear_conflict=False):
+        # children paired with their heuristic derived from the parent's h: only the moved tile's
+        # distance changes, and only the two lines it crosses between can change their conflicts
+        size, bits = self.size, self.bits
+        blank = code >> self.blank_shift
+        board = code & self.tile_mask
+        table = self.manhattan_table
+        children = []
+        for target in self.moves[blank]:
+            tile = (board >> (bits*target)) & self.nibble
+            child = (board - (tile << (bits*target)) + (tile << (bits*blank))) | (target << self.blank_shift)
+            child_h = h + table[tile][blank] - table[tile][target]
+            if linear_conflict:
+                if target // size == blank // size:
+                    lines, is_row = (target % size, blank % size), False
+                else:
+                    lines, is_row = (target // size, blank // size), True
+                for line in lines:
+                    child_h += self.line_conflict(child, line, is_row) - self.line_conflict(code, line, is_row)
+            children.append((child, child_h))
+        return children
+
+    def is_solvable(self, tiles):
+        seq = [t for t in tiles if t != 0]
+        inversions = sum(1 for i in range(len(seq)) for j in range(i + 1, len(seq)) if seq[i] > seq[j])
+        if self.size % 2 == 1:
+            return inversions % 2 == 0
+        blank_row_from_bottom = self.size - tiles.index(0) // self.size
+        return (inversions + blank_row_from_bottom) % 2 == 1
+
+PUZZLES = {}
+
+def puzzle(size):
+    if size not in PUZZLES:
+        PUZZLES[size] = SlidingPuzzle(size)
+    return PUZZLES[size]
+
+# 3 x 3 shorthands
+SIZE = 3
+EIGHT = puzzle(SIZE)
+encode = EIGHT.encode
+decode = EIGHT.decode
+successors = EIGHT.successors
+GOAL = EIGHT.goal
+
+# Additive disjoint pattern databases. Each table is indexed by the cells of its pattern tiles
+# (mixed radix, first tile least significant) and stores the fewest moves of *pattern* tiles needed
+# to bring them home, so the tables of disjoint patterns can be summed and stay admissible.
+PDB_MAGIC = b"AIPDB001"
+PDB_HEADER = struct.Struct("<8sII")
+
+def build_pattern_table(size, tiles):
+    cells = size * size
+    moves = neighbor_cells(size)
+    k = len(tiles)
+    weights = [cells ** j for j in range(k)]
+    goal_idx = sum((tile - 1) * weights[j] for j, tile in enumerate(tiles))
+    # retrograde 0-1 BFS over (pattern cells, blank cell): moving a pattern tile costs 1, any other tile 0
+    dist = bytearray(b"\xff") * (cells ** k * cells)
+    dist[goal_idx * cells + cells - 1] = 0
+    queue = deque([(goal_idx, cells - 1)])
+    while queue:
+        idx, blank = queue.popleft()
+        d = dist[idx * cells + blank]
+        positions = [(idx // weights[j]) % cells for j in range(k)]
+        for target in moves[blank]:
+            if target in positions:
+                j = positions.index(target)
+                new_idx = idx + (blank - target) * weights[j]
+                new_d = d + 1
+            else:
+                new_idx = idx
+                new_d = d
+            key = new_idx * cells + target
+            if new_d < dist[key]:
+                dist[key] = new_d
+                if new_d == d:
+                    queue.appendleft((new_idx, target))
+                else:
+                    queue.append((new_idx, target))
+    return bytearray(min(dist[i * cells:(i + 1) * cells]) for i in range(cells ** k))
+
+class PatternDatabase:
+    def __init__(self, size, patterns, tables):
+        self.size = size
+        self.cells = size * size
+        self.patterns = [tuple(p) for p in patterns]
+        self.tables = tables
+        self.mapped = None
+        self.pattern_of = [-1] * self.cells
+        self.weight_of = [0] * self.cells
+        for i, tiles in enumerate(self.patterns):
+            for j, tile in enumerate(tiles):
+                self.pattern_of[tile] = i
+                self.weight_of[tile] = self.cells ** j
+
+    @classmethod
+    def build(cls, size, patterns):
+        return cls(size, patterns, [build_pattern_table(size, tiles) for tiles in patterns])
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(PDB_HEADER.pack(PDB_MAGIC, self.size, len(self.patterns)))
+            for tiles in self.patterns:
+                f.write(struct.pack(f"<I{len(tiles)}B", len(tiles), *tiles))
+            for table in self.tables:
+                f.write(table)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size, num_patterns = PDB_HEADER.unpack_from(mapped, 0)
+        if magic != PDB_MAGIC:
+            mapped.close()
+            raise ValueError(f"{path}: not a pattern database file")
+        offset = PDB_HEADER.size
+        patterns = []
+        for _ in range(num_patterns):
+            (k,) = struct.unpack_from("<I", mapped, offset)
+            patterns.append(struct.unpack_from(f"<{k}B", mapped, offset + 4))
+            offset += 4 + k
+        cells = size * size
+        view = memoryview(mapped)
+        tables = []
+        for tiles in patterns:
+            length = cells ** len(tiles)
+            tables.append(view[offset:offset + length])
+            offset += length
+        pdb = cls(size, patterns, tables)
+        pdb.mapped = mapped
+        return pdb
+
+    def indices(self, tiles):
+        cells = self.cells
+        where = [0] * cells
+        for cell, tile in enumerate(tiles):
+            where[tile] = cell
+        result = []
+        for pattern in self.patterns:
+            idx = 0
+            for tile in reversed(pattern):
+                idx = idx * cells + where[tile]
+            result.append(idx)
+        return result
+
+    def heuristic(self, code):
+        return sum(table[idx] for table, idx in zip(self.tables, self.indices(puzzle(self.size).tiles(code))))
+
+DEFAULT_PATTERNS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 3, 5, 6), (4, 7, 8, 11, 12), (9, 10, 13, 14, 15)],
+}
+
+def load_or_build_pdb(size=SIZE, patterns=None, path=None):
+    if patterns is None:
+        if size not in DEFAULT_PATTERNS:
+            raise ValueError(f"no default pattern database for the {size}x{size} puzzle; pass patterns "
+                             f"(sizes with defaults: {sorted(DEFAULT_PATTERNS)})")
+        patterns = DEFAULT_PATTERNS[size]
+    if path is None:
+        name = "_".join("-".join(map(str, tiles)) for tiles in patterns)
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"pdb_{size}x{size}_{name}.pdb")
+    if not os.path.exists(path):
+        PatternDatabase.build(size, patterns).save(path)
+    return PatternDatabase.load(path)
+
+# Exact 8-puzzle distances. A solvable state is its blank cell plus an even permutation of the
+# eight tiles, so it is indexed as blank * 8!/2 + (Lehmer rank of the tiles) // 2, which packs all
+# 9!/2 = 181,440 reachable states densely; one retrograde BFS from the goal fills every entry.
+DIST_MAGIC = b"AIDST001"
+DIST_HEADER = struct.Struct("<8sII")
+HALF_RANKS = math.factorial(8) // 2
+TILE_FACTORIALS = [math.factorial(7 - i) for i in range(8)]
+UNREACHABLE = 0xff
+
+def state_index(code):
+    blank = code >> EIGHT.blank_shift
+    rank = 0
+    seen = 0
+    i = 0
+    for cell in range(EIGHT.cells):
+        if cell == blank:
+            continue
+        tile = (code >> (EIGHT.bits*cell)) & EIGHT.nibble
+        below = (1 << tile) - 2
+        rank += ((tile - 1) - (seen & below).bit_count()) * TILE_FACTORIALS[i]
+        seen |= 1 << tile
+        i += 1
+    return blank * HALF_RANKS + (rank >> 1)
+
+class DistanceTable:
+    def __init__(self, table):
+        self.table = table
+        self.mapped = None
+
+    @classmethod
+    def build(cls):
+        table = bytearray([UNREACHABLE]) * (EIGHT.cells * HALF_RANKS)
+        table[state_index(GOAL)] = 0
+        frontier = [GOAL]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for code in frontier:
+                for nb in successors(code):
+                    idx = state_index(nb)
+                    if table[idx] == UNREACHABLE:
+                        table[idx] = depth
+                        next_frontier.append(nb)
+            frontier = next_frontier
+        return cls(table)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(DIST_HEADER.pack(DIST_MAGIC, SIZE, len(self.table)))
+            f.write(self.table)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size, length = DIST_HEADER.unpack_from(mapped, 0)
+        if magic != DIST_MAGIC or size != SIZE or length != EIGHT.cells * HALF_RANKS:
+            mapped.close()
+            raise ValueError(f"{path}: not an 8-puzzle distance table")
+        table = cls(memoryview(mapped)[DIST_HEADER.size:DIST_HEADER.size + length])
+        table.mapped = mapped
+        return table
+
+    def distance(self, code):
+        # exact distance to GOAL, None if unsolvable (an odd permutation shares its index with an even one)
+        if not EIGHT.is_solvable(EIGHT.tiles(code)):
+            return None
+        return self.table[state_index(code)]
+
+    def heuristic(self, code):
+        return self.table[state_index(code)]
+
+def load_or_build_distance_table(path=None):
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dist_3x3.pdb")
+    if not os.path.exists(path):
+        DistanceTable.build().save(path)
+    return DistanceTable.load(path)
+
+def table_walk(start, table=None):
+    # optimal solve without search: from each state step to any neighbour one move closer
+    table = table or load_or_build_distance_table()
+    t0 = time.perf_counter()
+    code = encode(start)
+    d = table.distance(code)
+    nodes_expanded = 0
+    solution = None
+    if d is not None:
+        path = [code]
+        while d > 0:
+            nodes_expanded += 1
+            code = next(nb for nb in successors(code) if table.table[state_index(nb)] == d - 1)
+            path.append(code)
+            d -= 1
+        solution = [decode(c) for c in path]
+    time_s = time.perf_counter() - t0
+    # O(cost) work on a memory-mapped table: nothing worth tracing
+    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "peak_kb": None,
+            "cost": len(solution) - 1 if solution is not None else None}
+
+# Memory accounting. By default the solvers only track their peak frontier and closed-set sizes and
+# turn them into bytes from the size of a packed state plus the CPython container overhead per
+# entry, which costs a length check per expansion. "tracemalloc" and "rss" measure for real and are
+# meant for a separate pass, since both slow the search and would distort its time.
+POINTER_BYTES = 8
+HASH_ENTRY_BYTES = 36  # a dict/set slot (key, value, hash) plus its index at CPython's 2/3 load
+
+class MemoryMeter:
+    MODES = ("count", "tracemalloc", "rss")
+
+    def __init__(self, mode="count", frontier_entry_bytes=0, closed_entry_bytes=0, interval=0.001):
+        if mode not in self.MODES:
+            raise ValueError(f"memory mode must be one of {self.MODES}, not {mode!r}")
+        self.mode = mode
+        self.frontier_entry_bytes = frontier_entry_bytes
+        self.closed_entry_bytes = closed_entry_bytes
+        self.interval = interval
+        self.base_kb = 0.0
+        self.peak_rss_kb = 0.0
+        self.process = None
+        self.sampler = None
+        self.done = threading.Event()
+
+    def start(self):
+        if self.mode == "tracemalloc":
+            tracemalloc.start()
+        elif self.mode == "rss":
+            import psutil  # only the rss mode needs it
+            self.process = psutil.Process()
+            self.base_kb = self.peak_rss_kb = self.rss_kb()
+            self.sampler = threading.Thread(target=self.sample, daemon=True)
+            self.sampler.start()
+
+    def rss_kb(self):
+        return self.process.memory_info().rss / 1024.0
+
+    def sample(self):
+        while not self.done.wait(self.interval):
+            self.peak_rss_kb = max(self.peak_rss_kb, self.rss_kb())
+
+    def estimate(self, frontier, closed):
+        return frontier * self.frontier_entry_bytes + closed * self.closed_entry_bytes
+
+    def over_budget(self, budget, frontier, closed):
+        if self.mode == "tracemalloc":
+            return tracemalloc.get_traced_memory()[0] > budget
+        return self.estimate(frontier, closed) > budget
+
+    def stop(self, peak_frontier, peak_closed):
+        # -> {"peak_kb", "peak_frontier", "peak_closed", "memory_mode"}
+        if self.mode == "tracemalloc":
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024.0
+            tracemalloc.stop()
+        elif self.mode == "rss":
+            self.done.set()
+            self.sampler.join()
+            peak_kb = max(self.peak_rss_kb, self.rss_kb()) - self.base_kb
+        else:
+            peak_kb = self.estimate(peak_frontier, peak_closed) / 1024.0
+        return {"peak_kb": peak_kb, "peak_frontier": peak_frontier, "peak_closed": peak_closed,
+                "memory_mode": self.mode}
+
+def state_bytes(p):
+    # a packed state with the blank in the last cell is as wide as any state of the puzzle gets
+    return sys.getsizeof(p.goal)
 
 # A*
-def astar(start):
-    tracemalloc.start()
+def expander(p, heuristic, linear_conflict):
+    # returns (heuristic, expand) where expand(code, h) lists (child, child_h); without a custom
+    # heuristic the children's Manhattan (+ linear conflict) values are updated per move from h
+    if heuristic is None:
+        heuristic = p.manhattan_lc if linear_conflict else p.manhattan
+        return heuristic, lambda code, h: p.successors_h(code, h, linear_conflict)
+    return heuristic, lambda code, h: [(nb, heuristic(nb)) for nb in p.successors(code)]
+
+def reconstruct(came_from, code):
+    path = [code]
+    while came_from[code] is not None:
+        code = came_from[code]
+        path.append(code)
+    path.reverse()
+    return path
+
+MEMORY_CHECK_INTERVAL = 1024
+
+def astar(start, heuristic=None, linear_conflict=False, max_memory_kb=None, memory="count"):
+    # max_memory_kb: give up (solution None, "budget_exceeded" True) once memory (estimated, or traced
+    # with memory="tracemalloc") passes it
+    p = puzzle(len(start))
+    heuristic, expand = expander(p, heuristic, linear_conflict)
+    # frontier: heap tuple (f, g, h, state) + list slot; closed: state + best_g, came_from, visited slots
+    meter = MemoryMeter(memory, sys.getsizeof((0, 0, 0, 0)) + POINTER_BYTES,
+                        state_bytes(p) + 3 * HASH_ENTRY_BYTES)
+    meter.start()
+    peak_frontier = 0
     t0 = time.perf_counter()
     nodes_expanded = 0
     open_set = []
-    start_h = manhattan(start)
-    heapq.heappush(open_set, (start_h, 0, start_h, start, []))  # (f, g, h, state, path)
+    start_code = p.encode(start)
+    start_h = heuristic(start_code)
+    heapq.heappush(open_set, (start_h, 0, start_h, start_code))  # (f, g, h, state)
     visited = set()
-    best_g = {to_tuple(start): 0}
+    best_g = {start_code: 0}
+    came_from = {start_code: None}
+    budget = max_memory_kb * 1024 if max_memory_kb is not None else None
+    budget_exceeded = False
 
     solution = None
     while open_set:
-        f,g,h,state,path = heapq.heappop(open_set)
-        tup = to_tuple(state)
-        if g != best_g.get(tup, g):
+        if len(open_set) > peak_frontier:
+            peak_frontier = len(open_set)
+        f,g,h,code = heapq.heappop(open_set)
+        if g != best_g.get(code, g):
             continue
         nodes_expanded += 1
-        if state == goal_state:
-            solution = path + [state]
+        if code == p.goal:
+            solution = [p.decode(c) for c in reconstruct(came_from, code)]
             break
-        visited.add(tup)
-        for nb in neighbors(state):
-            nt = to_tuple(nb)
+        if budget is not None and nodes_expanded % MEMORY_CHECK_INTERVAL == 0 \
+                and meter.over_budget(budget, len(open_set), len(best_g)):
+            budget_exceeded = True
+            break
+        visited.add(code)
+        for nb, new_h in expand(code, h):
             new_g = g + 1
-            if nt in visited and new_g >= best_g.get(nt, math.inf):
+            if nb in visited and new_g >= best_g.get(nb, math.inf):
                 continue
-            if new_g < best_g.get(nt, math.inf):
-                best_g[nt] = new_g
-                new_h = manhattan(nb)
+            if new_g < best_g.get(nb, math.inf):
+                best_g[nb] = new_g
+                came_from[nb] = code
                 new_f = new_g + new_h
-                heapq.heappush(open_set, (new_f, new_g, new_h, nb, path+[state]))
+                heapq.heappush(open_set, (new_f, new_g, new_h, nb))
     t1 = time.perf_counter()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    peak_kb = peak/1024.0
+    mem = meter.stop(peak_frontier, len(best_g))
     time_s = t1 - t0
     if solution is None:
-        return {"solution": None, "nodes": nodes_expanded, "time": time_s, "peak_kb": peak_kb, "cost": None}
+        return {"solution": None, "nodes": nodes_expanded, "time": time_s, "cost": None,
+                "budget_exceeded": budget_exceeded, **mem}
     cost = len(solution)-1
-    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "peak_kb": peak_kb, "cost": cost}
+    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "cost": cost,
+            "budget_exceeded": False, **mem}
 
 #RBFS
-def rbfs(start):
-    tracemalloc.start()
+def rbfs(start, heuristic=None, linear_conflict=False, max_nodes=None, max_time=None, max_reexpansions=None,
+         memory="count"):
+    # explicit-stack RBFS: one frame per path state, each holding at most four successor entries
+    # [f, state, g, h, explored] kept in stable f order. The path lives in one shared buffer.
+    # A node counts as a re-expansion when it lies in a subtree RBFS had already explored and
+    # backed up before; any exceeded budget ends the search with "budget_exceeded" True.
+    p = puzzle(len(start))
+    heuristic, expand = expander(p, heuristic, linear_conflict)
+    # frontier: a five-field successor entry + its slot; closed: a path buffer slot + path set entry
+    meter = MemoryMeter(memory, sys.getsizeof([0] * 5) + POINTER_BYTES,
+                        state_bytes(p) + POINTER_BYTES + HASH_ENTRY_BYTES)
+    meter.start()
+    frontier = peak_frontier = 0
+    peak_depth = 1
     t0 = time.perf_counter()
     nodes_expanded = 0
+    reexpansions = 0
+    budget_exceeded = False
+
+    start_code = p.encode(start)
+    path = [start_code]
+    path_set = {start_code}
+    stack = []  # frames: [f_limit, successor entries, re-entered subtree]
+    found = False
 
-    def rbfs_recursive(state, path_set, path_list, g, f_limit):
-        nonlocal nodes_expanded
+    def open_frame(code, g, h, f_limit, reentered):
+        f = g + h
+        succs = []
+        for nb, nb_h in expand(code, h):
+            if nb not in path_set:
+                succs.append([max(g + 1 + nb_h, f), nb, g + 1, nb_h, False])
+        succs.sort(key=lambda entry: entry[0])
+        stack.append([f_limit, succs, reentered])
+        return len(succs)
+
+    nodes_expanded += 1
+    if start_code == p.goal:
+        found = True
+    else:
+        frontier = peak_frontier = open_frame(start_code, 0, heuristic(start_code), math.inf, False)
+    depth_reentered = 0  # frames on the stack that re-entered an explored subtree
+    while stack and not found:
+        f_limit, succs, _ = frame = stack[-1]
+        if not succs or succs[0][0] > f_limit:
+            backed_up = succs[0][0] if succs else math.inf
+            stack.pop()
+            frontier -= len(succs)
+            if frame[2]:
+                depth_reentered -= 1
+            path_set.discard(path.pop())
+            if not stack:
+                break
+            parent = stack[-1][1]
+            entry = parent[0]
+            entry[0] = backed_up
+            entry[4] = True
+            # stable re-sort of a list whose tail is already sorted: slide the head past smaller f's
+            i = 1
+            while i < len(parent) and parent[i][0] < backed_up:
+                parent[i-1] = parent[i]
+                i += 1
+            parent[i-1] = entry
+            continue
+
+        if (max_nodes is not None and nodes_expanded >= max_nodes) or \
+                (max_reexpansions is not None and reexpansions >= max_reexpansions) or \
+                (max_time is not None and time.perf_counter() - t0 > max_time):
+            budget_exceeded = True
+            break
+        best_f, best_code, best_g, best_h, explored = succs[0]
+        alt = succs[1][0] if len(succs) > 1 else math.inf
+        path.append(best_code)
+        if len(path) > peak_depth:
+            peak_depth = len(path)
+        path_set.add(best_code)
         nodes_expanded += 1
-        f = g + manhattan(state)
-        if state == goal_state:
-            return path_list + [state], 0
-
-        successors = []
-        for nb in neighbors(state):
-            tnb = to_tuple(nb)
-            if tnb in path_set:
-                continue
-            new_g = g+1
-            h = manhattan(nb)
-            f_cost = max(new_g + h, f)
-            successors.append([f_cost, nb, new_g, h])
+        if explored:
+            depth_reentered += 1
+        if depth_reentered:
+            reexpansions += 1
+        if best_code == p.goal:
+            found = True
+            break
+        frontier += open_frame(best_code, best_g, best_h, min(f_limit, alt), explored)
+        if frontier > peak_frontier:
+            peak_frontier = frontier
 
-        if not successors:
-            return None, math.inf
+    solution = [p.decode(c) for c in path] if found else None
+    t1 = time.perf_counter()
+    mem = meter.stop(peak_frontier, peak_depth)
+    time_s = t1 - t0
+    if solution is None:
+        return {"solution": None, "nodes": nodes_expanded, "time": time_s, "cost": None,
+                "reexpansions": reexpansions, "budget_exceeded": budget_exceeded, **mem}
+    cost = len(solution)-1
+    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "cost": cost,
+            "reexpansions": reexpansions, "budget_exceeded": False, **mem}
 
-        while True:
-            successors.sort(key=lambda x: x[0])
-            best = successors[0]
-            best_f, best_state, best_g, best_h = best
-            if best_f > f_limit:
-                return None, best_f
-            alt = successors[1][0] if len(successors) > 1 else math.inf
-            path_set.add(to_tuple(best_state))
-            result, best_f_new = rbfs_recursive(best_state, path_set, path_list+[state], best_g, min(f_limit, alt))
-            path_set.remove(to_tuple(best_state))
-            successors[0][0] = best_f_new
-            if result is not None:
-                return result, 0
+# Bidirectional MM: each side expands by priority max(g + h, 2g) toward the other end, so the two
+# searches meet in the middle. With unit moves the best meeting cost U is optimal once
+# U <= max(C, fmin_f, fmin_b, gmin_f + gmin_b + 1), where C is the smaller of the two top priorities.
+class Frontier:
+    def __init__(self, root, heuristic):
+        self.heuristic = heuristic
+        self.open = {}
+        self.closed = {}
+        self.parent = {root: None}
+        self.heaps = ([], [], [])  # entries keyed on priority, f and g; stale ones are skipped lazily
+        self.push(root, 0)
 
-    start_set = set([to_tuple(start)])
-    solution, _ = rbfs_recursive(start, start_set, [], 0, math.inf)
+    def push(self, code, g):
+        self.open[code] = g
+        f = g + self.heuristic(code)
+        pr_heap, f_heap, g_heap = self.heaps
+        heapq.heappush(pr_heap, (max(f, 2*g), g, code))
+        heapq.heappush(f_heap, (f, g, code))
+        heapq.heappush(g_heap, (g, g, code))
+
+    def top(self, which):
+        heap = self.heaps[which]
+        while heap and self.open.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else math.inf
+
+    def pop(self):
+        self.top(0)
+        _, g, code = heapq.heappop(self.heaps[0])
+        del self.open[code]
+        self.closed[code] = g
+        return code, g
+
+    def g(self, code):
+        g = self.open.get(code)
+        return self.closed.get(code) if g is None else g
+
+    def path_to(self, code):
+        path = []
+        while code is not None:
+            path.append(code)
+            code = self.parent[code]
+        return path
+
+def bidirectional_mm(start, memory="count"):
+    p = puzzle(len(start))
+    # frontier: three heap tuples + slots and an open-map entry; closed: state + closed and parent entries
+    meter = MemoryMeter(memory, 3 * (sys.getsizeof((0, 0, 0)) + POINTER_BYTES) + HASH_ENTRY_BYTES,
+                        state_bytes(p) + 2 * HASH_ENTRY_BYTES)
+    meter.start()
+    peak_frontier = peak_closed = 0
+    t0 = time.perf_counter()
+    nodes_expanded = 0
+    start_code = p.encode(start)
+    best_cost, meet = (0, start_code) if start_code == p.goal else (math.inf, None)
+    if p.is_solvable(p.tiles(start_code)):
+        forward = Frontier(start_code, p.manhattan)
+        backward = Frontier(p.goal, lambda code, table=p.manhattan_table_to(start_code): p.manhattan(code, table))
+        while forward.open and backward.open:
+            c_f, c_b = forward.top(0), backward.top(0)
+            if best_cost <= max(min(c_f, c_b), forward.top(1), backward.top(1),
+                                forward.top(2) + backward.top(2) + 1):
+                break
+            side, other = (forward, backward) if c_f <= c_b else (backward, forward)
+            code, g = side.pop()
+            nodes_expanded += 1
+            for nb in p.successors(code):
+                new_g = g + 1
+                old_g = side.g(nb)
+                if old_g is not None and old_g <= new_g:
+                    continue
+                side.closed.pop(nb, None)
+                side.parent[nb] = code
+                side.push(nb, new_g)
+                other_g = other.g(nb)
+                if other_g is not None and new_g + other_g < best_cost:
+                    best_cost, meet = new_g + other_g, nb
+            if len(forward.open) + len(backward.open) > peak_frontier:
+                peak_frontier = len(forward.open) + len(backward.open)
+    solution = None
+    if meet is not None:
+        solution = [p.decode(c) for c in forward.path_to(meet)[::-1] + backward.path_to(meet)[1:]]
     t1 = time.perf_counter()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    peak_kb = peak/1024.0
+    if nodes_expanded:
+        peak_closed = len(forward.closed) + len(backward.closed)
+    mem = meter.stop(peak_frontier, peak_closed)
     time_s = t1 - t0
     if solution is None:
-        return {"solution": None, "nodes": nodes_expanded, "time": time_s, "peak_kb": peak_kb, "cost": None}
+        return {"solution": None, "nodes": nodes_expanded, "time": time_s, "cost": None, **mem}
     cost = len(solution)-1
-    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "peak_kb": peak_kb, "cost": cost}
+    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "cost": cost, **mem}
+
+# IDA*
+def ida_star(start, pdb=None, max_nodes=None):
+    # depth-first contours over one mutable board: each move updates the heuristic by a delta
+    # and the search never moves the blank straight back to the cell it just left
+    p = puzzle(len(start))
+    moves = p.moves
+    board = [tile for row in start for tile in row]
+    blank = board.index(0)
+    if not p.is_solvable(board):
+        # no contour would ever contain the goal: the bounds would just keep growing
+        return {"solution": None, "nodes": 0, "time": 0.0, "peak_kb": None, "cost": None, "iterations": 0,
+                "nodes_per_s": 0.0}
+    if pdb is None:
+        table = p.manhattan_table
+        h = sum(table[tile][cell] for cell, tile in enumerate(board))
+
+        def delta(tile, src, dst):
+            return table[tile][dst] - table[tile][src]
+    else:
+        tables, pattern_of, weight_of = pdb.tables, pdb.pattern_of, pdb.weight_of
+        idx = pdb.indices(board)
+        h = sum(t[i] for t, i in zip(tables, idx))
+
+        def delta(tile, src, dst):
+            k = pattern_of[tile]
+            if k < 0:
+                return 0
+            old = idx[k]
+            idx[k] = old + (dst - src) * weight_of[tile]
+            return tables[k][idx[k]] - tables[k][old]
+
+    t0 = time.perf_counter()
+    nodes_expanded = 0
+    iterations = 0
+    path = []
+    FOUND = -1
+
+    def search(g, bound, prev):
+        nonlocal nodes_expanded, blank, h
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0 and board == p.goal_tiles:
+            return FOUND
+        nodes_expanded += 1
+        if max_nodes is not None and nodes_expanded > max_nodes:
+            return math.inf
+        minimum = math.inf
+        here = blank
+        for target in moves[here]:
+            if target == prev:
+                continue
+            tile = board[target]
+            d = delta(tile, target, here)
+            board[here], board[target] = tile, 0
+            blank = target
+            h += d
+            path.append(target)
+            t = search(g + 1, bound, here)
+            if t == FOUND:
+                return FOUND
+            path.pop()
+            h -= d
+            delta(tile, here, target)
+            board[target], board[here] = tile, 0
+            blank = here
+            if t < minimum:
+                minimum = t
+        return minimum
+
+    bound = h
+    solution = None
+    while True:
+        iterations += 1
+        t = search(0, bound, -1)
+        if t == FOUND:
+            tiles = [tile for row in start for tile in row]
+            empty = tiles.index(0)
+            solution = [p.decode(p.encode(start))]
+            for target in path:
+                tiles[empty], tiles[target] = tiles[target], 0
+                empty = target
+                solution.append([tiles[r*p.size:(r+1)*p.size] for r in range(p.size)])
+            break
+        if t == math.inf:
+            break
+        bound = t
+    time_s = time.perf_counter() - t0
+    # memory is O(depth) for IDA*; it is not traced so the nodes/s figure stays undistorted
+    return {"solution": solution, "nodes": nodes_expanded, "time": time_s, "peak_kb": None,
+            "cost": len(path) if solution is not None else None, "iterations": iterations,
+            "nodes_per_s": nodes_expanded / time_s if time_s > 0 else 0.0}
 
 def moves_from_solution(solution):
     if not solution:
@@ -140,13 +820,200 @@ def moves_from_solution(solution):
         moves.append(moved_tile)
     return moves
 
-if __name__ == "__main__":
+def iter_instances(path):
+    # one puzzle per line: N*N whitespace-separated tiles, 0 for the blank, row-major
+    with open(path) as f:
+        for line in f:
+            tiles = [int(tok) for tok in line.replace(",", " ").split()]
+            if not tiles:
+                continue
+            size = math.isqrt(len(tiles))
+            if size * size != len(tiles) or sorted(tiles) != list(range(size * size)):
+                raise ValueError(f"{path}: not an N x N puzzle: {line.strip()}")
+            yield [tiles[r*size:(r+1)*size] for r in range(size)]
+
+def read_instances(path):
+    return list(iter_instances(path))
+
+def run_ida_benchmark(path, use_pdb=False, max_nodes=None):
+    rows = []
+    for num, start in enumerate(read_instances(path), 1):
+        size = len(start)
+        if not puzzle(size).is_solvable([tile for row in start for tile in row]):
+            print(f"Instance {num}: not solvable, skipped")
+            continue
+        pdb = None
+        if use_pdb:
+            try:
+                pdb = load_or_build_pdb(size)
+            except ValueError as e:
+                print(f"Instance {num}: {e}; using Manhattan distance")
+        res = ida_star(start, pdb, max_nodes)
+        print(f"Instance {num}: cost={res['cost']} nodes={res['nodes']} time={res['time']:.3f}s "
+              f"({res['nodes_per_s']:,.0f} nodes/s)")
+        rows.append({"Instance": num, "Size": f"{size}x{size}", "Solution_cost": res["cost"],
+                     "Nodes_expanded": res["nodes"], "Iterations": res["iterations"],
+                     "Time_s": res["time"], "Nodes_per_s": res["nodes_per_s"]})
+    df = pd.DataFrame(rows)
+    if rows:
+        print("\nIDA* Summary:")
+        print(df.to_string(index=False))
+        total_time = df["Time_s"].sum()
+        print(f"Total: {df['Nodes_expanded'].sum()} nodes in {total_time:.2f} s "
+              f"({df['Nodes_expanded'].sum() / total_time if total_time else 0:,.0f} nodes/s)")
+    return df
+
+# Batch solving. Transposing the board and relabelling every tile with the tile whose goal cell is
+# the transposed one maps the goal onto itself, so a state and its transpose share one solution (up
+# to that relabelling) and the smaller packed code of the two is the cache key.
+def transpose_labels(size):
+    return [0] + [(t-1) % size * size + (t-1) // size + 1 for t in range(1, size * size)]
+
+def canonical(start):
+    # returns (size, code, flipped): the cache key and whether it is the transposed board
+    size = len(start)
+    p = puzzle(size)
+    labels = transpose_labels(size)
+    flipped = [[labels[start[r][c]] for r in range(size)] for c in range(size)]
+    code, flipped_code = p.encode(start), p.encode(flipped)
+    if flipped_code < code:
+        return size, flipped_code, True
+    return size, code, False
+
+def solve_instance(key):
+    size, code = key
+    p = puzzle(size)
+    tiles = p.tiles(code)
+    if not p.is_solvable(tiles):
+        return {"moves": None, "cost": None, "nodes": 0, "time": 0.0}
+    res = astar(p.decode(code), linear_conflict=True)
+    return {"moves": moves_from_solution(res["solution"]), "cost": res["cost"], "nodes": res["nodes"],
+            "time": res["time"]}
+
+class SolutionCache:
+    # LRU of solved canonical states, optionally backed by a shelve file that outlives the process
+    def __init__(self, max_entries=100000, path=None):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.disk = shelve.open(path) if path else None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is None and self.disk is not None:
+            result = self.disk.get(f"{key[0]}:{key[1]}")
+            if result is not None:
+                self.put(key, result, persist=False)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return result
+
+    def put(self, key, result, persist=True):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        if persist and self.disk is not None:
+            self.disk[f"{key[0]}:{key[1]}"] = result
+
+    def close(self):
+        if self.disk is not None:
+            self.disk.close()
+            self.disk = None
+
+def solve_batch(instances, workers=None, chunksize=16, window=1024, cache=None):
+    # yields one result per instance, in input order. Instances are read `window` at a time, cache
+    # hits and repeats inside the window are answered without solving, and the remaining distinct
+    # states go to the pool in chunks of `chunksize`, each yielded as soon as its result is back
+    cache = cache if cache is not None else SolutionCache()
+    workers = workers or os.cpu_count()
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    instances = iter(instances)
+    index = 0
+    try:
+        while True:
+            block = list(islice(instances, window))
+            if not block:
+                break
+            keys = [canonical(start) for start in block]
+            missing = [key for key in dict.fromkeys((size, code) for size, code, _ in keys)
+                       if cache.get(key) is None]
+            solved = pool.map(solve_instance, missing, chunksize=chunksize) if pool else map(solve_instance, missing)
+            pending = set(missing)
+            for start, (size, code, flipped) in zip(block, keys):
+                fresh = (size, code) in pending
+                if fresh:
+                    # missing keys are in order of first appearance, so the next result out of the
+                    # in-order map is this one; later keys are still being solved while it is yielded
+                    pending.discard((size, code))
+                    entry = next(solved)
+                    cache.put((size, code), entry)
+                else:
+                    entry = cache.entries.get((size, code)) or solve_instance((size, code))
+                result = dict(entry)
+                if flipped and result["moves"] is not None:
+                    labels = transpose_labels(size)
+                    result["moves"] = [labels[tile] for tile in result["moves"]]
+                result["cached"] = not fresh
+                result["index"] = index
+                result["state"] = [tile for row in start for tile in row]
+                index += 1
+                yield result
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+def run_batch(path, workers=None, chunksize=16, cache_path=None):
+    cache = SolutionCache(path=cache_path)
+    t0 = time.perf_counter()
+    count = reused = 0
+    try:
+        for result in solve_batch(iter_instances(path), workers, chunksize, cache=cache):
+            print(json.dumps(result), flush=True)
+            count += 1
+            reused += result["cached"]
+    finally:
+        cache.close()
+    elapsed = time.perf_counter() - t0
+    print(f"Solved {count} instances in {elapsed:.2f} s, {reused} answered from the cache or a repeat "
+          f"(distinct states: {cache.hits} cached, {cache.misses} solved)", flush=True)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sliding-tile puzzle solvers (A*, RBFS, IDA*).")
+    parser.add_argument("--ida", metavar="FILE",
+                        help="solve every N x N instance in FILE with IDA* (goal: 1..N*N-1 then the blank)")
+    parser.add_argument("--pdb", action="store_true", help="use the additive pattern database heuristic")
+    parser.add_argument("--max-nodes", type=int, default=None, help="per-instance IDA* node budget")
+    parser.add_argument("--memory", choices=MemoryMeter.MODES, default="count",
+                        help="demo memory figures: estimated from peak frontier/closed sizes (count), or measured "
+                             "with tracemalloc or RSS sampling, which slows the timed search")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="solve every instance in FILE with A* and stream JSON results in input order")
+    parser.add_argument("--workers", type=int, default=None, help="batch worker processes (default: all CPUs)")
+    parser.add_argument("--chunksize", type=int, default=16, help="instances per batch task sent to a worker")
+    parser.add_argument("--cache", metavar="FILE", default=None, help="persistent batch solution cache (shelve)")
+    return parser.parse_args()
+
+def demo(memory="count"):
     start = [[1,2,3],
              [4,0,6],
              [7,5,8]]
 
-    a_res = astar(start)
-    rbfs_res = rbfs(start)
+    a_res = astar(start, memory=memory)
+    rbfs_res = rbfs(start, memory=memory)
+    pdb = load_or_build_pdb(SIZE)
+    a_pdb_res = astar(start, pdb.heuristic, memory=memory)
+    rbfs_pdb_res = rbfs(start, pdb.heuristic, memory=memory)
+    ida_res = ida_star(start)
+    a_lc_res = astar(start, linear_conflict=True, memory=memory)
+    dist_table = load_or_build_distance_table()
+    a_table_res = astar(start, dist_table.heuristic, memory=memory)
+    walk_res = table_walk(start, dist_table)
+    mm_res = bidirectional_mm(start, memory=memory)
 
     # A*
     print("A* Solution:")
@@ -157,7 +1024,8 @@ if __name__ == "__main__":
             print("-----")
     print(f"Nodes Expanded: {a_res['nodes']}")
     print(f"Time Taken: {a_res['time']:.6f} s")
-    print(f"Peak Memory: {a_res['peak_kb']:.2f} KB")
+    print(f"Peak Memory: {a_res['peak_kb']:.2f} KB ({a_res['memory_mode']}; "
+          f"frontier {a_res['peak_frontier']}, closed {a_res['peak_closed']})")
     print(f"Solution Cost: {a_res['cost']}")
     print(f"Moves: {moves_from_solution(a_res['solution'])}")
 
@@ -170,16 +1038,41 @@ if __name__ == "__main__":
             print("-----")
     print(f"Nodes Expanded: {rbfs_res['nodes']}")
     print(f"Time Taken: {rbfs_res['time']:.6f} s")
-    print(f"Peak Memory: {rbfs_res['peak_kb']:.2f} KB")
+    print(f"Peak Memory: {rbfs_res['peak_kb']:.2f} KB ({rbfs_res['memory_mode']}; "
+          f"frontier {rbfs_res['peak_frontier']}, path {rbfs_res['peak_closed']})")
     print(f"Solution Cost: {rbfs_res['cost']}")
+    print(f"Re-expansions: {rbfs_res['reexpansions']} ({rbfs_res['reexpansions'] / rbfs_res['nodes']:.1%} of expansions)")
     print(f"Moves: {moves_from_solution(rbfs_res['solution'])}")
 
     df = pd.DataFrame([
         {"Algorithm": "A*", "Time_s": a_res["time"], "Nodes_expanded": a_res["nodes"],
          "Peak_memory_KB": a_res["peak_kb"], "Solution_cost": a_res["cost"]},
         {"Algorithm": "RBFS", "Time_s": rbfs_res["time"], "Nodes_expanded": rbfs_res["nodes"],
-         "Peak_memory_KB": rbfs_res["peak_kb"], "Solution_cost": rbfs_res["cost"]}
+         "Peak_memory_KB": rbfs_res["peak_kb"], "Solution_cost": rbfs_res["cost"]},
+        {"Algorithm": "A* (PDB)", "Time_s": a_pdb_res["time"], "Nodes_expanded": a_pdb_res["nodes"],
+         "Peak_memory_KB": a_pdb_res["peak_kb"], "Solution_cost": a_pdb_res["cost"]},
+        {"Algorithm": "RBFS (PDB)", "Time_s": rbfs_pdb_res["time"], "Nodes_expanded": rbfs_pdb_res["nodes"],
+         "Peak_memory_KB": rbfs_pdb_res["peak_kb"], "Solution_cost": rbfs_pdb_res["cost"]},
+        {"Algorithm": "A* (LC)", "Time_s": a_lc_res["time"], "Nodes_expanded": a_lc_res["nodes"],
+         "Peak_memory_KB": a_lc_res["peak_kb"], "Solution_cost": a_lc_res["cost"]},
+        {"Algorithm": "IDA*", "Time_s": ida_res["time"], "Nodes_expanded": ida_res["nodes"],
+         "Peak_memory_KB": ida_res["peak_kb"], "Solution_cost": ida_res["cost"]},
+        {"Algorithm": "A* (table)", "Time_s": a_table_res["time"], "Nodes_expanded": a_table_res["nodes"],
+         "Peak_memory_KB": a_table_res["peak_kb"], "Solution_cost": a_table_res["cost"]},
+        {"Algorithm": "Table walk", "Time_s": walk_res["time"], "Nodes_expanded": walk_res["nodes"],
+         "Peak_memory_KB": walk_res["peak_kb"], "Solution_cost": walk_res["cost"]},
+        {"Algorithm": "Bidirectional MM", "Time_s": mm_res["time"], "Nodes_expanded": mm_res["nodes"],
+         "Peak_memory_KB": mm_res["peak_kb"], "Solution_cost": mm_res["cost"]}
     ])
 
     print("\nComparison Table:")
     print(df.to_string(index=False))
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.ida:
+        run_ida_benchmark(args.ida, args.pdb, args.max_nodes)
+    elif args.batch:
+        run_batch(args.batch, args.workers, args.chunksize, args.cache)
+    else:
+        demo(args.memory)
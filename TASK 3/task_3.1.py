@@ -1,5 +1,7 @@
 import random
 import math
+import sys
+import threading
 import time
 import tracemalloc
 from typing import List, Tuple, Optional, Callable, Iterable
@@ -16,6 +18,29 @@ def argmin(items: Iterable, key: Callable):
             best_item, best_val = it, val
     return best_item, best_val
 
+def state_bytes(state) -> int:
+    return sys.getsizeof(state) + sum(sys.getsizeof(x) for x in state)
+
+class PeakMeter:
+    # peak bytes of the states a search keeps alive at once. A climb observe()s what it holds whenever
+    # that grows; a restart loop hold()s the best state it carries between climbs, so the climbs it
+    # runs are counted on top of it
+    def __init__(self):
+        self.held = 0
+        self.peak = 0
+
+    def observe(self, nbytes: int):
+        if self.held + nbytes > self.peak:
+            self.peak = self.held + nbytes
+
+    def hold(self, nbytes: int) -> int:
+        self.held += nbytes
+        self.observe(0)
+        return nbytes
+
+    def release(self, nbytes: int):
+        self.held -= nbytes
+
 # Class for 8 Queens
 class EightQueens:
     def __init__(self, n: int = 8, seed: Optional[int] = None):
@@ -36,10 +61,11 @@ class EightQueens:
                     conflicts += 1
         return conflicts
 
-    def best_neighbor(self, state: List[int]) -> Tuple[List[int], int]:
+    def best_neighbor(self, state: List[int], meter: Optional[PeakMeter] = None) -> Tuple[List[int], int]:
         n = self.n
         current_h = self.heuristic(state)
         best = (state, current_h)
+        unit = state_bytes(state) if meter is not None else 0
         for c in range(n):
             original_row = state[c]
             for r in range(n):
@@ -47,38 +73,159 @@ class EightQueens:
                     continue
                 neighbor = state.copy()
                 neighbor[c] = r
+                if meter is not None:
+                    meter.observe(unit * (2 if best[0] is state else 3))
                 h = self.heuristic(neighbor)
                 if h < best[1]:
                     best = (neighbor, h)
         return best
 
-    def hill_climb(self, start: Optional[List[int]] = None, max_steps: int = 1000) -> Tuple[List[int], int, int]:
+    def hill_climb(self, start: Optional[List[int]] = None, max_steps: int = 1000,
+                   meter: Optional[PeakMeter] = None) -> Tuple[List[int], int, int]:
         state = start if start is not None else self.random_state()
         h = self.heuristic(state)
+        if meter is not None:
+            meter.observe(state_bytes(state))
         steps = 0
         while steps < max_steps and h > 0:
             steps += 1
-            neighbor, h2 = self.best_neighbor(state)
+            neighbor, h2 = self.best_neighbor(state, meter)
             if h2 < h:
                 state, h = neighbor, h2
             else:
                 break  # local minimum / plateau
         return state, h, steps
 
-    def random_restart(self, max_restarts: int = 100, max_steps: int = 1000) -> Tuple[List[int], int, int, int]:
+    def random_restart(self, max_restarts: int = 100, max_steps: int = 1000,
+                       meter: Optional[PeakMeter] = None) -> Tuple[List[int], int, int, int]:
         best_state = None
         best_h = math.inf
+        best_bytes = 0
         total_steps = 0
         restarts = 0
         for r in range(max_restarts):
             restarts += 1
             start = self.random_state()
-            state, h, steps = self.hill_climb(start, max_steps)
+            state, h, steps = self.hill_climb(start, max_steps, meter)
+            total_steps += steps
+            if h < best_h:
+                best_state, best_h = state, h
+                if meter is not None:
+                    meter.release(best_bytes)
+                    best_bytes = meter.hold(state_bytes(best_state))
+            if best_h == 0:
+                break
+        if meter is not None:
+            meter.release(best_bytes)
+        return best_state, best_h, restarts, total_steps
+
+    # Min-conflicts for large n. States are kept as permutations, so every row holds one queen and
+    # only the 2n-1 diagonals and 2n-1 anti-diagonals need occupancy counters; a move swaps the
+    # rows of two columns and its effect on h (attacking pairs) is read off four counters each way.
+    def greedy_state(self, tries_per_queen: float = 3.08) -> List[int]:
+        # place columns left to right, sampling unused rows until one sits on free diagonals;
+        # once the sampling budget runs out the remaining columns keep their random rows
+        n = self.n
+        state = list(range(n))
+        self.rng.shuffle(state)
+        diag = [False] * (2 * n - 1)
+        anti = [False] * (2 * n - 1)
+        c = 0
+        for _ in range(int(tries_per_queen * n)):
+            if c == n:
+                break
+            j = c + self.rng.randrange(n - c)
+            state[c], state[j] = state[j], state[c]
+            r = state[c]
+            if not diag[r - c + n - 1] and not anti[r + c]:
+                diag[r - c + n - 1] = anti[r + c] = True
+                c += 1
+        return state
+
+    def min_conflicts(self, start: Optional[List[int]] = None, max_steps: Optional[int] = None,
+                      meter: Optional[PeakMeter] = None) -> Tuple[List[int], int, int]:
+        n = self.n
+        state = list(start) if start is not None else self.greedy_state()
+        if sorted(state) != list(range(n)):
+            raise ValueError("min_conflicts needs a start with one queen per row (a permutation)")
+        max_steps = max_steps if max_steps is not None else 50 * n
+        rng = self.rng
+        diag = [0] * (2 * n - 1)
+        anti = [0] * (2 * n - 1)
+        for c, r in enumerate(state):
+            diag[r - c + n - 1] += 1
+            anti[r + c] += 1
+        h = sum(k * (k - 1) // 2 for k in diag) + sum(k * (k - 1) // 2 for k in anti)
+        conflicted = []
+        if meter is not None:
+            # the state, both counter arrays and the conflicted-column list (its ints are the state's own)
+            held = state_bytes(state) + sys.getsizeof(diag) + sys.getsizeof(anti)
+            meter.observe(held)
+        steps = 0
+        while h > 0 and steps < max_steps:
+            if not conflicted:
+                conflicted = [c for c in range(n) if diag[state[c] - c + n - 1] > 1 or anti[state[c] + c] > 1]
+                if meter is not None:
+                    meter.observe(held + sys.getsizeof(conflicted))
+            k = rng.randrange(len(conflicted))
+            i = conflicted[k]
+            ri = state[i]
+            if diag[ri - i + n - 1] == 1 and anti[ri + i] == 1:
+                # resolved by an earlier move: drop it from the candidates
+                conflicted[k] = conflicted[-1]
+                conflicted.pop()
+                continue
+            steps += 1
+            j = rng.randrange(n)
+            if j == i:
+                continue
+            rj = state[j]
+            # lift both queens (each leaves k-1 partners behind), then drop them on the swapped rows
+            new_h = h
+            for r, c in ((ri, i), (rj, j)):
+                diag[r - c + n - 1] -= 1
+                anti[r + c] -= 1
+                new_h -= diag[r - c + n - 1] + anti[r + c]
+            for r, c in ((rj, i), (ri, j)):
+                new_h += diag[r - c + n - 1] + anti[r + c]
+                diag[r - c + n - 1] += 1
+                anti[r + c] += 1
+            if new_h <= h:  # sideways swaps too, to drift off plateaus
+                state[i], state[j] = rj, ri
+                h = new_h
+                if diag[ri - j + n - 1] > 1 or anti[ri + j] > 1:
+                    conflicted.append(j)
+                    if meter is not None:
+                        meter.observe(held + sys.getsizeof(conflicted))
+            else:
+                for r, c in ((rj, i), (ri, j)):
+                    diag[r - c + n - 1] -= 1
+                    anti[r + c] -= 1
+                for r, c in ((ri, i), (rj, j)):
+                    diag[r - c + n - 1] += 1
+                    anti[r + c] += 1
+        return state, h, steps
+
+    def min_conflicts_restart(self, max_restarts: int = 100, max_steps: Optional[int] = None,
+                              meter: Optional[PeakMeter] = None) -> Tuple[List[int], int, int, int]:
+        best_state = None
+        best_h = math.inf
+        best_bytes = 0
+        total_steps = 0
+        restarts = 0
+        for _ in range(max_restarts):
+            restarts += 1
+            state, h, steps = self.min_conflicts(None, max_steps, meter)
             total_steps += steps
             if h < best_h:
                 best_state, best_h = state, h
+                if meter is not None:
+                    meter.release(best_bytes)
+                    best_bytes = meter.hold(state_bytes(best_state))
             if best_h == 0:
                 break
+        if meter is not None:
+            meter.release(best_bytes)
         return best_state, best_h, restarts, total_steps
 
 # Class for 8 puzzle
@@ -95,6 +242,12 @@ class EightPuzzle:
         7: (-3, -1, 1),
         8: (-3, -1),
     }
+    # MANHATTAN_TABLE[tile][idx]: distance of tile at idx from its goal cell
+    MANHATTAN_TABLE = [
+        [0] * 9 if tile == 0 else
+        [abs(idx // 3 - (tile - 1) // 3) + abs(idx % 3 - (tile - 1) % 3) for idx in range(9)]
+        for tile in range(9)
+    ]
 
     def __init__(self, seed: Optional[int] = None):
         self.rng = random.Random(seed)
@@ -121,6 +274,18 @@ class EightPuzzle:
             neigh.append(tuple(s))
         return neigh
 
+    def neighbors_with_h(self, state: Tuple[int, ...], h: int) -> List[Tuple[Tuple[int, ...], int]]:
+        # only the slid tile changes cell, so each child's h is the parent's h plus its delta
+        i0 = state.index(0)
+        neigh = []
+        for d in self.NEIGHBOR_DELTAS[i0]:
+            j = i0 + d
+            row = self.MANHATTAN_TABLE[state[j]]
+            s = list(state)
+            s[i0], s[j] = s[j], s[i0]
+            neigh.append((tuple(s), h + row[i0] - row[j]))
+        return neigh
+
     @staticmethod
     def is_solvable(state: Tuple[int, ...]) -> bool:
         arr = [x for x in state if x != 0]
@@ -142,15 +307,22 @@ class EightPuzzle:
         start: Optional[Tuple[int, ...]] = None,
         max_steps: int = 1000,
         sideways_limit: int = 20,
+        meter: Optional[PeakMeter] = None,
     ) -> Tuple[Tuple[int, ...], int, int, bool]:
         current = start if start is not None else self.random_state()
         h = self.manhattan(current)
+        if meter is not None:
+            unit = state_bytes(current)
+            meter.observe(unit)
         steps = 0
         sideways = 0
         while steps < max_steps and h > 0:
             steps += 1
-            neigh = self.neighbors(current)
-            best, best_h = argmin(neigh, key=self.manhattan)
+            neigh = self.neighbors_with_h(current, h)
+            if meter is not None:
+                # current plus the (state, h) pairs of every neighbour
+                meter.observe(unit + sys.getsizeof(neigh) + sum(sys.getsizeof(pair) + unit for pair in neigh))
+            (best, _), best_h = argmin(neigh, key=lambda pair: pair[1])
             if best_h < h:
                 current, h = best, best_h
                 sideways = 0
@@ -167,9 +339,11 @@ class EightPuzzle:
         max_steps: int = 2000,
         sideways_limit: int = 30,
         scramble_moves: int = 50,
+        meter: Optional[PeakMeter] = None,
     ) -> Tuple[Tuple[int, ...], int, int, int, bool]:
         best_state = None
         best_h = math.inf
+        best_bytes = 0
         total_steps = 0
         restarts = 0
         solved = False
@@ -177,13 +351,18 @@ class EightPuzzle:
             restarts += 1
             start = self.random_state(scramble_moves)
             assert self.is_solvable(start)
-            state, h, steps, reached = self.hill_climb(start, max_steps, sideways_limit)
+            state, h, steps, reached = self.hill_climb(start, max_steps, sideways_limit, meter)
             total_steps += steps
             if h < best_h:
                 best_state, best_h = state, h
+                if meter is not None:
+                    meter.release(best_bytes)
+                    best_bytes = meter.hold(state_bytes(best_state))
             if reached:
                 solved = True
                 break
+        if meter is not None:
+            meter.release(best_bytes)
         return best_state, best_h, restarts, total_steps, solved
 
 # Class for Travelling Salesman
@@ -217,68 +396,124 @@ class TSP:
     def two_opt_swap(self, tour: List[int], i: int, k: int) -> List[int]:
         return tour[:i] + list(reversed(tour[i:k + 1])) + tour[k + 1:]
 
-    def best_2opt_neighbor(self, tour: List[int]) -> Tuple[List[int], float]:
+    def best_2opt_neighbor(self, tour: List[int], meter: Optional[PeakMeter] = None) -> Tuple[List[int], float]:
         best = (tour, self.tour_length(tour))
         n = self.n
         current_len = best[1]
+        unit = state_bytes(tour) if meter is not None else 0
         for i in range(n - 1):
             for k in range(i + 1, n):
                 neighbor = self.two_opt_swap(tour, i, k)
+                if meter is not None:
+                    meter.observe(unit * (2 if best[0] is tour else 3))
                 L = self.tour_length(neighbor)
                 if L < current_len:
                     current_len = L
                     best = (neighbor, L)
         return best
 
-    def hill_climb(self, start: Optional[List[int]] = None, max_steps: int = 1000) -> Tuple[List[int], float, int]:
+    def hill_climb(self, start: Optional[List[int]] = None, max_steps: int = 1000,
+                   meter: Optional[PeakMeter] = None) -> Tuple[List[int], float, int]:
         tour = self.random_tour() if start is None else start
         length = self.tour_length(tour)
+        if meter is not None:
+            meter.observe(state_bytes(tour))
         steps = 0
         while steps < max_steps:
             steps += 1
-            neigh, L = self.best_2opt_neighbor(tour)
+            neigh, L = self.best_2opt_neighbor(tour, meter)
             if L < length:
                 tour, length = neigh, L
             else:
                 break
         return tour, length, steps
 
-    def random_restart(self, max_restarts: int = 50, max_steps: int = 1000) -> Tuple[List[int], float, int, int]:
+    def random_restart(self, max_restarts: int = 50, max_steps: int = 1000,
+                       meter: Optional[PeakMeter] = None) -> Tuple[List[int], float, int, int]:
         best_tour = None
         best_len = math.inf
+        best_bytes = 0
         total_steps = 0
         restarts = 0
         for _ in range(max_restarts):
             restarts += 1
             start = self.random_tour()
-            tour, L, steps = self.hill_climb(start, max_steps)
+            tour, L, steps = self.hill_climb(start, max_steps, meter)
             total_steps += steps
             if L < best_len:
                 best_tour, best_len = tour, L
+                if meter is not None:
+                    meter.release(best_bytes)
+                    best_bytes = meter.hold(state_bytes(best_tour))
+        if meter is not None:
+            meter.release(best_bytes)
         return best_tour, best_len, restarts, total_steps
 
 
-def measure_function(fn: Callable, *args, **kwargs):
-    tracemalloc.start()
+def measure_peak_kb(fn: Callable, mode: str, *args, **kwargs) -> float:
+    # a pass of its own: tracing allocations (or polling RSS from a thread) slows fn down
+    if mode == "tracemalloc":
+        tracemalloc.start()
+        fn(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 1024.0
+    import psutil  # only the rss mode needs it
+    process = psutil.Process()
+
+    def rss_kb():
+        return process.memory_info().rss / 1024.0
+
+    base = peak_rss = rss_kb()
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak_rss
+        while not done.wait(0.001):
+            peak_rss = max(peak_rss, rss_kb())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    fn(*args, **kwargs)
+    done.set()
+    sampler.join()
+    return max(peak_rss, rss_kb()) - base
+
+
+def measure_function(fn: Callable, *args, memory: str = "estimate",
+                     rng: Optional[random.Random] = None, **kwargs):
+    # memory="estimate" passes fn a PeakMeter as `meter` and reports the peak the search counted;
+    # "tracemalloc" and "rss" rerun fn to measure, with rng (the problem's generator) rewound so the
+    # rerun repeats the timed run
+    rng_state = rng.getstate() if rng is not None else None
+    if memory == "estimate":
+        kwargs["meter"] = meter = PeakMeter()
     t0 = time.perf_counter()
     result = fn(*args, **kwargs)
     t1 = time.perf_counter()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return {"result": result, "time_s": t1 - t0, "peak_kb": peak / 1024.0}
+    if memory == "estimate":
+        peak_kb = meter.peak / 1024.0
+    elif memory in ("tracemalloc", "rss"):
+        if rng is not None:
+            rng.setstate(rng_state)
+        peak_kb = measure_peak_kb(fn, memory, *args, **kwargs)
+    else:
+        raise ValueError(f"unknown memory mode: {memory!r}")
+    return {"result": result, "time_s": t1 - t0, "peak_kb": peak_kb}
 
 
-def run_comparison_1run(problem_name: str, hill_fn: Callable, rr_fn: Callable, trials: int = 10):
+def run_comparison_1run(problem_name: str, hill_fn: Callable, rr_fn: Callable, trials: int = 10,
+                        memory: str = "estimate", rng: Optional[random.Random] = None):
     hill_stats = []
     for _ in range(trials):
-        m = measure_function(hill_fn)
+        m = measure_function(hill_fn, memory=memory, rng=rng)
         hill_stats.append(m)
 
     hill_times = [h["time_s"] for h in hill_stats]
     hill_peaks = [h["peak_kb"] for h in hill_stats]
     hill_results = [h["result"] for h in hill_stats]
 
-    rrm = measure_function(rr_fn)
+    rrm = measure_function(rr_fn, memory=memory, rng=rng)
     rr_result = rrm["result"]
 
     summary = {"problem": problem_name}
@@ -342,32 +577,43 @@ if __name__ == "__main__":
 
     # Eight-Queens
     q = EightQueens(n=8, seed=random_seed)
-    def q_hill():
-        return q.hill_climb(start=None, max_steps=2000)
-    def q_rr():
-        return q.random_restart(max_restarts=200, max_steps=2000)
-    q_summary = run_comparison_1run("8-Queens", q_hill, q_rr, trials=20)
+    def q_hill(meter=None):
+        return q.hill_climb(start=None, max_steps=2000, meter=meter)
+    def q_rr(meter=None):
+        return q.random_restart(max_restarts=200, max_steps=2000, meter=meter)
+    q_summary = run_comparison_1run("8-Queens", q_hill, q_rr, trials=20, rng=q.rng)
+
+    # n-Queens with min-conflicts (greedy start, O(1) swap evaluation)
+    def mc_hill(meter=None):
+        return q.min_conflicts(meter=meter)
+    def mc_rr(meter=None):
+        return q.min_conflicts_restart(max_restarts=200, meter=meter)
+    mc_summary = run_comparison_1run("8-Queens (MC)", mc_hill, mc_rr, trials=20, rng=q.rng)
+    big_q = EightQueens(n=100000, seed=random_seed)
+    big_summary = run_comparison_1run("100000-Queens (MC)", big_q.min_conflicts, big_q.min_conflicts_restart,
+                                     trials=1, rng=big_q.rng)
 
     # Eight-Puzzle
     p = EightPuzzle(seed=random_seed)
-    def p_hill():
+    def p_hill(meter=None):
         start = p.random_state(scramble_moves=50)
-        return p.hill_climb(start=start, max_steps=2000, sideways_limit=50)
-    def p_rr():
-        return p.random_restart(max_restarts=200, max_steps=2000, sideways_limit=50, scramble_moves=50)
-    p_summary = run_comparison_1run("8-Puzzle", p_hill, p_rr, trials=20)
+        return p.hill_climb(start=start, max_steps=2000, sideways_limit=50, meter=meter)
+    def p_rr(meter=None):
+        return p.random_restart(max_restarts=200, max_steps=2000, sideways_limit=50, scramble_moves=50,
+                                meter=meter)
+    p_summary = run_comparison_1run("8-Puzzle", p_hill, p_rr, trials=20, rng=p.rng)
 
     # TSP (n=20 for moderate difficulty)
     rng = random.Random(random_seed)
     coords = [(rng.random(), rng.random()) for _ in range(20)]
     tsp = TSP(coords, seed=random_seed)
-    def t_hill():
-        return tsp.hill_climb(start=None, max_steps=2000)
-    def t_rr():
-        return tsp.random_restart(max_restarts=100, max_steps=2000)
-    t_summary = run_comparison_1run("TSP(20)", t_hill, t_rr, trials=10)
+    def t_hill(meter=None):
+        return tsp.hill_climb(start=None, max_steps=2000, meter=meter)
+    def t_rr(meter=None):
+        return tsp.random_restart(max_restarts=100, max_steps=2000, meter=meter)
+    t_summary = run_comparison_1run("TSP(20)", t_hill, t_rr, trials=10, rng=tsp.rng)
 
-    summaries = [q_summary, p_summary, t_summary]
+    summaries = [q_summary, mc_summary, big_summary, p_summary, t_summary]
 
     # a clean comparison table
     header = [